@@ -0,0 +1,60 @@
+# =====================================================================
+# FILE: Import_Time_Benchmark.py
+# AIM: Measures how long the portfolio scripts take to import as libraries, and
+# checks that importing them pulls in none of the heavy optional dependencies.
+# =====================================================================
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+MODULES = ['SHM_Data_Fitter_Verbose', 'Waterloo_Simulation', 'LAB_03_Data_Analysis', 'Trapezoidal_Integration']
+
+# Libraries that should only be imported when a plot, fit or file load actually needs them
+HEAVY_DEPENDENCIES = ['matplotlib', 'scipy', 'pandas', 'pyarrow', 'concurrent.futures.process']
+
+# Run in a fresh interpreter so every measurement is a cold import. numpy is imported
+# first and timed separately: it is a hard dependency of every module and costs the
+# same whichever of them is imported.
+PROBE = """
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import numpy
+numpy_done = time.perf_counter()
+import {module}
+module_done = time.perf_counter()
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(numpy_done - start, module_done - numpy_done, ','.join(heavy))
+"""
+
+def time_import(module, repeats=5):
+    """Median (numpy seconds, module seconds) over fresh interpreters, plus heavy modules loaded."""
+    root = os.path.dirname(os.path.abspath(__file__))
+    numpy_times, module_times = [], []
+    heavy = []
+    for _ in range(repeats):
+        code = PROBE.format(root=root, module=module, heavy=HEAVY_DEPENDENCIES)
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        numpy_time, module_time, loaded = out.split(' ')
+        numpy_times.append(float(numpy_time))
+        module_times.append(float(module_time))
+        heavy = [name for name in loaded.strip().split(',') if name]
+    return statistics.median(numpy_times), statistics.median(module_times), heavy
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold import time of each portfolio module.")
+    parser.add_argument('modules', nargs='*', default=MODULES, help="modules to time (default: all)")
+    parser.add_argument('--repeats', type=int, default=5, help="fresh interpreters per module (median is reported)")
+    args = parser.parse_args(argv)
+
+    print(f"{'Module':<26}{'numpy (ms)':>12}{'module (ms)':>13}{'total (ms)':>12}  heavy imports")
+    for module in args.modules:
+        numpy_time, module_time, heavy = time_import(module, args.repeats)
+        print(f"{module:<26}{1e3 * numpy_time:>12.1f}{1e3 * module_time:>13.1f}"
+              f"{1e3 * (numpy_time + module_time):>12.1f}  {', '.join(heavy) or 'none'}")
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,557 @@
+import glob
+import hashlib
+import json
+import os
+import shutil
 import numpy as np
-import pandas as pd
-
-# Load data and get column names
-df = pd.read_csv("poisson-data.csv")
-
-# --- FIX: Rename the columns explicitly for clean printing ---
-df.columns = ['Data Set 1', 'Data Set 2']
-
-# Use the new, clean column names
-column_1_name = df.columns[0] 
-column_2_name = df.columns[1] 
-
-data_1 = df[column_1_name]
-data_2 = df[column_2_name]
-
-# --- Calculations (Unchanged) ---
-mean_1 = np.mean(data_1)
-std_dev_1 = np.std(data_1, ddof=0)
-std_err_1 = std_dev_1 / np.sqrt(len(data_1)) 
-sqrt_mean_1 = np.sqrt(mean_1)
-
-mean_2 = np.mean(data_2)
-std_dev_2 = np.std(data_2, ddof=0)
-std_err_2 = std_dev_2 / np.sqrt(len(data_2))
-sqrt_mean_2 = np.sqrt(mean_2)
-
-# --- Display Results (Now using clean names) ---
-print(f"--- Results for Data Set: {column_1_name} ---")
-print(f"Mean:                 {mean_1:.4f}")
-print(f"Standard Deviation:   {std_dev_1:.4f}")
-print(f"Standard Error (SE):  {std_err_1:.4f}")
-print(f"Square Root of Mean:  {sqrt_mean_1:.4f}")
-print("\n")
-print(f"--- Results for Data Set: {column_2_name} ---")
-print(f"Mean:                 {mean_2:.4f}")
-print(f"Standard Deviation:   {std_dev_2:.4f}")
-print(f"Standard Error (SE):  {std_err_2:.4f}")
-print(f"Square Root of Mean:  {sqrt_mean_2:.4f}")
+
+# pandas is only needed to read CSV files, so it is imported where a CSV is read rather
+# than here: importing this module as a library stays fast and runs nothing.
+
+# Rows per chunk when streaming a file: 2**20 rows of a few float64 columns is tens of MB
+CHUNK_ROWS = 2**20
+
+# Parsed CSVs are cached as binary columns in this directory, next to the source file
+CACHE_DIR_NAME = '.lab03_cache'
+
+def column_names(n_columns):
+    """Clean display names for n data columns: 'Data Set 1', 'Data Set 2', ..."""
+    return [f'Data Set {i + 1}' for i in range(n_columns)]
+
+def load_data(path="poisson-data.csv"):
+    """Reads the whole data file into a DataFrame (fine for small files; see stream_file)."""
+    import pandas as pd
+
+    # Load data and get column names
+    df = pd.read_csv(path)
+
+    # --- FIX: Rename the columns explicitly for clean printing ---
+    df.columns = column_names(len(df.columns))
+    return df
+
+def column_summary(data):
+    """Mean, population standard deviation, standard error and square root of the mean."""
+    mean = np.mean(data)
+    std_dev = np.std(data, ddof=0)
+    return {
+        'mean': mean,
+        'std_dev': std_dev,
+        'std_err': std_dev / np.sqrt(len(data)),
+        'sqrt_mean': np.sqrt(mean),
+    }
+
+# --- Streaming Statistics ---
+
+class ColumnStats:
+    """
+    Single-pass summary of any number of data columns: per-column count, mean and sum of
+    squared deviations, combined chunk by chunk with Welford/Chan updates. Only these
+    three arrays are kept, so memory does not grow with the data, and two partial
+    summaries (e.g. of different chunks or files) can be merged exactly. Missing
+    values (NaN) are skipped per column.
+
+    With histogram=True it also keeps per-column counts of each value 0, 1, 2, ... (the
+    input must then be non-negative integer counts) for the Poisson goodness-of-fit test.
+    """
+
+    def __init__(self, n_columns, histogram=False):
+        self.count = np.zeros(n_columns, dtype=np.int64)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.hist = CountHistograms.empty(n_columns) if histogram else None
+
+    def update(self, block):
+        """Adds a 2-D block of rows (one column per data set)."""
+        block = np.asarray(block, dtype=np.float64)
+        valid = ~np.isnan(block)
+        count = valid.sum(axis=0)
+        if not count.any():
+            return
+        batch = ColumnStats(block.shape[1], histogram=self.hist is not None)
+        batch.count = count
+        if batch.hist is not None:
+            batch.hist = count_histograms(block, valid)
+        if count.min() == len(block):
+            # No missing values: skip the masking passes
+            batch.mean = block.mean(axis=0)
+            batch.m2 = ((block - batch.mean)**2).sum(axis=0)
+        else:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                batch.mean = np.where(valid, block, 0.0).sum(axis=0) / count
+            batch.mean[count == 0] = 0.0
+            batch.m2 = np.where(valid, (block - batch.mean)**2, 0.0).sum(axis=0)
+        self.merge(batch)
+
+    def merge(self, other):
+        """Combines another summary of the same columns into this one."""
+        n = self.count + other.count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(n > 0, other.count / n, 0.0)
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * weight
+        self.m2 = self.m2 + other.m2 + delta**2 * self.count * weight
+        self.count = n
+        if self.hist is not None and other.hist is not None:
+            self.hist = self.hist.merge(other.hist)
+
+    def summary(self):
+        """Per-column arrays of the lab statistics: mean, std_dev (ddof=0), std_err, sqrt_mean."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std_dev = np.sqrt(self.m2 / self.count)
+            return {
+                'count': self.count,
+                'mean': np.where(self.count > 0, self.mean, np.nan),
+                'std_dev': std_dev,
+                'std_err': std_dev / np.sqrt(self.count),
+                'sqrt_mean': np.sqrt(np.where(self.count > 0, self.mean, np.nan)),
+            }
+
+# --- Poisson Consistency Tests ---
+
+# Expected count below which histogram bins are pooled with their neighbours
+MIN_EXPECTED = 5.0
+
+class CountHistograms:
+    """
+    Per-column histograms of non-negative integer counts. Column j counts the values
+    base[j] .. base[j] + width[j] - 1, so each histogram only spans the values its own
+    column has taken. All columns share one flat array, column j's bins starting at
+    offsets[j], so building and merging stay vectorised however many columns there are.
+    """
+
+    def __init__(self, base, width, counts):
+        self.base = base
+        self.width = width
+        self.offsets = np.cumsum(width) - width
+        self.counts = counts
+
+    @classmethod
+    def empty(cls, n_columns):
+        zeros = np.zeros(n_columns, dtype=np.int64)
+        return cls(zeros, zeros.copy(), np.zeros(0, dtype=np.int64))
+
+    def column(self, j):
+        """(base, counts) of column j's histogram."""
+        start = self.offsets[j]
+        return int(self.base[j]), self.counts[start:start + self.width[j]]
+
+    def _destinations(self, base, offsets):
+        """Flat indices of this histogram's bins in a layout with the given base and offsets."""
+        columns = np.repeat(np.arange(len(self.width)), self.width)
+        position = np.arange(len(self.counts)) - np.repeat(self.offsets, self.width)
+        return offsets[columns] + self.base[columns] - base[columns] + position
+
+    def merge(self, other):
+        """Sum of two histograms of the same columns, each column widened to cover both."""
+        big = np.iinfo(np.int64).max
+        lo = np.minimum(np.where(self.width > 0, self.base, big), np.where(other.width > 0, other.base, big))
+        hi = np.maximum(np.where(self.width > 0, self.base + self.width, -1),
+                        np.where(other.width > 0, other.base + other.width, -1))
+        seen = hi >= 0
+        merged = CountHistograms(np.where(seen, lo, 0), np.where(seen, hi - lo, 0), None)
+        merged.counts = np.zeros(int(merged.width.sum()), dtype=np.int64)
+        for part in (self, other):
+            merged.counts[part._destinations(merged.base, merged.offsets)] += part.counts
+        return merged
+
+def count_histograms(block, valid=None):
+    """
+    CountHistograms of a 2-D block of non-negative integer counts (NaN where not valid).
+
+    All columns are counted by one np.bincount call: column j's values are shifted down
+    by its minimum and up by its offset in the flat array, so each column fills its own
+    stretch of a single histogram sized to that column's range of values.
+    """
+    block = np.asarray(block)
+    if valid is not None and valid.all():
+        valid = None
+    if valid is not None:
+        block = np.where(valid, block, 0)
+    counts = block.astype(np.int64)
+    if counts.size and (counts.min() < 0 or not np.array_equal(counts, block)):
+        raise ValueError("Poisson histograms need non-negative integer counts")
+    if valid is None:
+        lo, hi = counts.min(axis=0, initial=np.iinfo(np.int64).max), counts.max(axis=0, initial=-1)
+    else:
+        lo = np.where(valid, counts, np.iinfo(np.int64).max).min(axis=0, initial=np.iinfo(np.int64).max)
+        hi = np.where(valid, counts, -1).max(axis=0, initial=-1)
+    seen = hi >= 0
+    hist = CountHistograms(np.where(seen, lo, 0), np.where(seen, hi - lo + 1, 0), None)
+    counts += hist.offsets - hist.base
+    index = counts[valid] if valid is not None else counts.ravel()
+    hist.counts = np.bincount(index, minlength=int(hist.width.sum()))
+    return hist
+
+def _pooled_chi_square(hist, n, mean):
+    """
+    Per-column chi-square statistics and degrees of freedom of CountHistograms against
+    n * Poisson(mean), computed on the flat bins of all columns at once.
+
+    Each column's first and last bins hold its whole lower and upper tails. Bins are
+    pooled into groups by their cumulative expected count within the column (a group
+    per MIN_EXPECTED of it), which pools the sparse tails and, for large means, the
+    many thinly populated bins in between. A group that still expects fewer than
+    MIN_EXPECTED counts joins the previous group of its column (the next one at the
+    start of a column). Columns left with no degrees of freedom get (nan, 0).
+    """
+    from scipy.stats import poisson
+
+    n_columns = len(hist.width)
+    chi_square, dof = np.full(n_columns, np.nan), np.zeros(n_columns, dtype=np.int64)
+    if not len(hist.counts):
+        return chi_square, dof
+
+    # Column, value and expected count of every flat bin
+    column = np.repeat(np.arange(n_columns), hist.width)
+    position = np.arange(len(hist.counts)) - hist.offsets[column]
+    k = hist.base[column] + position
+    mu = mean[column]
+    expected = n[column] * poisson.pmf(k, mu)
+    used = hist.width > 0
+    first, last = hist.offsets[used], (hist.offsets + hist.width - 1)[used]
+    expected[first] = n[used] * poisson.cdf(k[first], mu[first])
+    expected[last] = n[used] * poisson.sf(k[last] - 1, mu[last])
+    single = used & (hist.width == 1)
+    expected[hist.offsets[single]] = n[single]
+
+    # Group bins by the cumulative expected count before them, within their column
+    cumulative = np.cumsum(expected)
+    before = cumulative - expected - (cumulative - expected)[hist.offsets[column]]
+    label = np.floor(before / MIN_EXPECTED)
+    starts = np.flatnonzero(np.r_[True, (column[1:] != column[:-1]) | (label[1:] != label[:-1])])
+    group_column = column[starts]
+    group_expected = np.add.reduceat(expected, starts)
+    group_observed = np.add.reduceat(hist.counts.astype(np.float64), starts)
+
+    # Fold groups short of MIN_EXPECTED into the nearest big group of the same column
+    n_groups = len(starts)
+    index = np.arange(n_groups)
+    big = group_expected >= MIN_EXPECTED
+    previous = np.maximum.accumulate(np.where(big, index, -1))
+    following = np.minimum.accumulate(np.where(big, index, n_groups)[::-1])[::-1]
+    column_first = np.searchsorted(group_column, group_column)
+    target = np.where(big, index,
+             np.where((previous >= 0) & (group_column[np.maximum(previous, 0)] == group_column), previous,
+             np.where((following < n_groups) & (group_column[np.minimum(following, n_groups - 1)] == group_column),
+                      following, column_first)))
+    pooled_expected = np.bincount(target, weights=group_expected, minlength=n_groups)
+    pooled_observed = np.bincount(target, weights=group_observed, minlength=n_groups)
+    kept = np.unique(target)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        terms = (pooled_observed[kept] - pooled_expected[kept])**2 / pooled_expected[kept]
+    dof = np.bincount(group_column[kept], minlength=n_columns) - 2
+    totals = np.bincount(group_column[kept], weights=terms, minlength=n_columns)
+    usable = (dof > 0) & (n > 1)
+    return np.where(usable, totals, np.nan), np.where(usable, dof, 0)
+
+def poisson_report(stats, alpha=0.01):
+    """
+    Tests every column of a histogram-carrying ColumnStats against Poisson(mean) at once.
+
+    - Dispersion index D = sample variance / mean (1 for a Poisson process); under the
+      Poisson hypothesis (n - 1) * D follows chi2(n - 1), giving a two-sided p-value.
+    - Chi-square goodness of fit of the histogram against n * Poisson(mean) pmf, its
+      first and last bins holding the whole lower and upper tails. Bins are pooled
+      until each expects at least MIN_EXPECTED counts, and one degree of freedom is
+      lost to the fitted mean (see _pooled_chi_square).
+
+    Returns a dict of per-column arrays; 'consistent' is True where neither test
+    rejects at level alpha. A column whose histogram leaves no degrees of freedom after
+    pooling (e.g. a very low rate) gets a NaN chi-square and is judged by the dispersion
+    test alone; one with fewer than two values cannot be tested at all ('testable' False).
+    """
+    from scipy.stats import chi2
+
+    n = stats.count.astype(np.float64)
+    mean = stats.mean
+    with np.errstate(invalid='ignore', divide='ignore'):
+        variance = stats.m2 / (n - 1)
+        dispersion = variance / mean
+        d_stat = (n - 1) * dispersion
+        dispersion_p = np.minimum(1.0, 2 * np.minimum(chi2.cdf(d_stat, n - 1), chi2.sf(d_stat, n - 1)))
+
+    chi_square, dof = _pooled_chi_square(stats.hist, n, mean)
+    chi_square_p = np.where(dof > 0, chi2.sf(chi_square, np.maximum(dof, 1)), np.nan)
+
+    return {
+        'count': stats.count,
+        'mean': mean,
+        'variance': variance,
+        'dispersion': dispersion,
+        'dispersion_p': dispersion_p,
+        'chi_square': chi_square,
+        'dof': dof,
+        'chi_square_p': chi_square_p,
+        'consistent': (dispersion_p >= alpha) & ~(chi_square_p < alpha),
+        'testable': np.isfinite(dispersion_p),
+    }
+
+def poisson_test(data, alpha=0.01):
+    """poisson_report for an in-memory 2-D array or wide DataFrame of counts (one column per data set)."""
+    data = np.asarray(data, dtype=np.float64)
+    stats = ColumnStats(data.shape[1], histogram=True)
+    stats.update(data)
+    return poisson_report(stats, alpha)
+
+def print_poisson_report(names, report, alpha=0.01):
+    """Compact table of the Poisson consistency tests, one line per column."""
+    width = max(12, max(len(name) for name in names) + 2)
+    print(f"--- Poisson Consistency (alpha = {alpha}) ---")
+    print(f"{'Column':<{width}}{'Mean':>10}{'Variance':>10}{'D':>8}{'p(D)':>9}"
+          f"{'Chi2':>10}{'dof':>5}{'p(Chi2)':>9}  Verdict")
+    for i, name in enumerate(names):
+        if not report['testable'][i]:
+            verdict = 'n/a'
+        elif report['consistent'][i]:
+            verdict = 'Poisson' if report['dof'][i] else 'Poisson (D only)'
+        else:
+            verdict = 'REJECT'
+        print(f"{name:<{width}}{report['mean'][i]:>10.4f}{report['variance'][i]:>10.4f}"
+              f"{report['dispersion'][i]:>8.4f}{report['dispersion_p'][i]:>9.4f}"
+              f"{report['chi_square'][i]:>10.2f}{report['dof'][i]:>5d}{report['chi_square_p'][i]:>9.4f}  {verdict}")
+
+def iter_csv_chunks(path, chunk_rows=CHUNK_ROWS):
+    """Yields the numeric contents of a CSV file as 2-D float arrays of up to chunk_rows rows."""
+    import pandas as pd
+
+    for chunk in pd.read_csv(path, chunksize=chunk_rows, dtype=np.float64):
+        yield chunk.to_numpy()
+
+def iter_binary_chunks(path, n_columns=None, dtype=np.float64, chunk_rows=CHUNK_ROWS):
+    """
+    Yields row blocks of a binary dump through a memory map, so only the block being
+    processed is paged in. A '.npy' file carries its own shape and dtype; any other
+    file is read as raw row-major values of `dtype` with n_columns per row.
+    """
+    if path.endswith('.npy'):
+        data = np.load(path, mmap_mode='r')
+    else:
+        if n_columns is None:
+            raise ValueError("n_columns is required for a raw binary dump")
+        data = np.memmap(path, dtype=dtype, mode='r').reshape(-1, n_columns)
+    data = data.reshape(len(data), -1)
+    for start in range(0, len(data), chunk_rows):
+        yield data[start:start + chunk_rows]
+
+# --- Binary Column Cache for Parsed CSVs ---
+
+def default_cache_dir(path):
+    """The cache directory used for a file when none is given."""
+    return os.path.join(os.path.dirname(os.path.abspath(path)), CACHE_DIR_NAME)
+
+def cache_entry(path, cache_dir=None):
+    """
+    Cache directory for the current version of a CSV: '<path hash>-<size>-<mtime_ns>'.
+    Editing or replacing the source changes its size or mtime and hence the entry name,
+    so a stale cache is never read.
+    """
+    path = os.path.abspath(path)
+    info = os.stat(path)
+    path_hash = hashlib.sha1(path.encode()).hexdigest()[:16]
+    return os.path.join(cache_dir or default_cache_dir(path), f'{path_hash}-{info.st_size}-{info.st_mtime_ns}')
+
+def _column_path(entry, i):
+    return os.path.join(entry, f'column-{i:04d}.f8')
+
+def iter_csv_chunks_caching(path, entry, chunk_rows=CHUNK_ROWS):
+    """
+    Yields the CSV's chunks like iter_csv_chunks while appending each column to its own
+    raw float64 file. The entry is built under a temporary name and renamed into place
+    once the whole file has been read, then older entries for the same path are removed.
+    """
+    tmp = f'{entry}.tmp-{os.getpid()}'
+    os.makedirs(tmp)
+    files = []
+    rows = 0
+    try:
+        for block in iter_csv_chunks(path, chunk_rows):
+            if not files:
+                files = [open(_column_path(tmp, i), 'wb') for i in range(block.shape[1])]
+            for i, fh in enumerate(files):
+                np.ascontiguousarray(block[:, i], dtype='<f8').tofile(fh)
+            rows += len(block)
+            yield block
+    except BaseException:
+        # Includes the consumer stopping early: never leave a partial entry behind
+        for fh in files:
+            fh.close()
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    for fh in files:
+        fh.close()
+    if not files:
+        shutil.rmtree(tmp, ignore_errors=True)
+        return
+
+    with open(os.path.join(tmp, 'meta.json'), 'w') as fh:
+        json.dump({'source': os.path.abspath(path), 'rows': rows, 'columns': len(files)}, fh)
+    prefix = os.path.basename(entry).split('-')[0] + '-'
+    cache_dir = os.path.dirname(entry)
+    for name in os.listdir(cache_dir):
+        if name.startswith(prefix) and '.tmp-' not in name:
+            shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+    try:
+        os.replace(tmp, entry)
+    except OSError:
+        # Another process finished the same entry first; theirs is just as good
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def load_cached_columns(entry):
+    """Memory-maps every column of a complete cache entry (None if there is no such entry)."""
+    meta_path = os.path.join(entry, 'meta.json')
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path) as fh:
+        meta = json.load(fh)
+    if meta['rows'] == 0:
+        return [np.zeros(0) for _ in range(meta['columns'])]
+    return [np.memmap(_column_path(entry, i), dtype='<f8', mode='r', shape=(meta['rows'],))
+            for i in range(meta['columns'])]
+
+def iter_column_chunks(columns, chunk_rows=CHUNK_ROWS):
+    """Yields row blocks assembled from memory-mapped columns."""
+    for start in range(0, len(columns[0]), chunk_rows):
+        yield np.column_stack([column[start:start + chunk_rows] for column in columns])
+
+def iter_cached_csv_chunks(path, chunk_rows=CHUNK_ROWS, cache_dir=None):
+    """CSV chunks from the binary cache when it is current, otherwise parsed and cached on the way."""
+    entry = cache_entry(path, cache_dir)
+    columns = load_cached_columns(entry)
+    if columns is not None:
+        return iter_column_chunks(columns, chunk_rows)
+    try:
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+    except OSError:
+        # e.g. a read-only data directory: parse without caching
+        return iter_csv_chunks(path, chunk_rows)
+    return iter_csv_chunks_caching(path, entry, chunk_rows)
+
+def load_columns(path, cache_dir=None):
+    """
+    The CSV's columns as read-only memory-mapped float64 arrays (NaN where missing),
+    parsing and caching the file first if its cache entry is missing or stale.
+    """
+    entry = cache_entry(path, cache_dir)
+    if load_cached_columns(entry) is None:
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        for _ in iter_csv_chunks_caching(path, entry):
+            pass
+    return load_cached_columns(entry) or []
+
+def stream_file(path, chunk_rows=CHUNK_ROWS, n_columns=None, dtype=np.float64, histogram=False,
+                cache=True, cache_dir=None):
+    """
+    Computes ColumnStats for a CSV or binary dump in one pass with constant memory.
+    Files ending in '.csv' are parsed in chunks (and, with cache=True, read from or
+    written to the binary column cache); anything else is memory-mapped.
+    """
+    if path.endswith('.csv') and cache:
+        chunks = iter_cached_csv_chunks(path, chunk_rows, cache_dir)
+    elif path.endswith('.csv'):
+        chunks = iter_csv_chunks(path, chunk_rows)
+    else:
+        chunks = iter_binary_chunks(path, n_columns, dtype, chunk_rows)
+    stats = None
+    for block in chunks:
+        if stats is None:
+            stats = ColumnStats(block.shape[1], histogram)
+        stats.update(block)
+    if stats is None:
+        raise ValueError(f"{path} contains no data rows")
+    return stats
+
+def stream_files(paths, workers=None, chunk_rows=CHUNK_ROWS, n_columns=None, dtype=np.float64,
+                 histogram=False, cache=True, cache_dir=None):
+    """
+    Streams many files (e.g. a day's shards) across a process pool, one file per task.
+    Returns ([(path, ColumnStats), ...] in the order given, merged ColumnStats); the
+    per-file partials are merged exactly, so the totals match a single pass over all rows.
+    """
+    paths = list(paths)
+    args = (chunk_rows, n_columns, dtype, histogram, cache, cache_dir)
+    if workers == 1 or len(paths) == 1:
+        partials = [stream_file(path, *args) for path in paths]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(stream_file, paths, *([arg] * len(paths) for arg in args)))
+
+    total = ColumnStats(len(partials[0].count), histogram)
+    for path, stats in zip(paths, partials):
+        if len(stats.count) != len(total.count):
+            raise ValueError(f"{path} has {len(stats.count)} columns, expected {len(total.count)}")
+        total.merge(stats)
+    return list(zip(paths, partials)), total
+
+def expand_paths(patterns):
+    """Expands glob patterns (quoted on the command line) into a sorted, de-duplicated file list."""
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        paths.extend(path for path in matches if path not in paths)
+    return paths
+
+def print_file_table(per_file, names):
+    """One line per file and column: count, mean, standard deviation, SE and sqrt(mean)."""
+    width = max(len(os.path.basename(path)) for path, _ in per_file)
+    print(f"{'File':<{width}}  {'Column':<12}{'Count':>12}{'Mean':>12}{'Std Dev':>12}{'SE':>12}{'sqrt(Mean)':>12}")
+    for path, stats in per_file:
+        summary = stats.summary()
+        for i, name in enumerate(names):
+            print(f"{os.path.basename(path):<{width}}  {name:<12}{summary['count'][i]:>12d}"
+                  f"{summary['mean'][i]:>12.4f}{summary['std_dev'][i]:>12.4f}"
+                  f"{summary['std_err'][i]:>12.4f}{summary['sqrt_mean'][i]:>12.4f}")
+
+def print_summary(name, summary):
+    """Prints one column's summary in the lab report layout."""
+    print(f"--- Results for Data Set: {name} ---")
+    print(f"Mean:                 {summary['mean']:.4f}")
+    print(f"Standard Deviation:   {summary['std_dev']:.4f}")
+    print(f"Standard Error (SE):  {summary['std_err']:.4f}")
+    print(f"Square Root of Mean:  {summary['sqrt_mean']:.4f}")
+
+def main(argv=None):
+    """Streams the data file(s) and prints the summary for each data set."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Summary statistics for the Poisson counting data.")
+    parser.add_argument('paths', nargs='*', default=["poisson-data.csv"],
+                        help="CSV files, .npy arrays or raw binary dumps with one column per data set; "
+                             "quoted glob patterns such as 'shards/*.csv' are expanded")
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help="rows read per chunk")
+    parser.add_argument('--columns', type=int, help="columns per row of a raw binary dump")
+    parser.add_argument('--dtype', default='float64', help="value type of a raw binary dump")
+    parser.add_argument('--workers', type=int, help="processes for multi-file runs (default: all cores)")
+    parser.add_argument('--no-cache', action='store_true', help="always parse CSV text; do not read or write the binary cache")
+    parser.add_argument('--cache-dir', help=f"where to cache parsed CSVs (default: {CACHE_DIR_NAME} next to each file)")
+    parser.add_argument('--poisson-test', action='store_true',
+                        help="test each column against a Poisson distribution (dispersion index and chi-square)")
+    parser.add_argument('--alpha', type=float, default=0.01, help="significance level for --poisson-test")
+    args = parser.parse_args(argv)
+
+    paths = expand_paths(args.paths)
+    if not paths:
+        parser.error(f"no files match {' '.join(args.paths)}")
+    per_file, stats = stream_files(paths, args.workers, args.chunk_rows, args.columns, np.dtype(args.dtype),
+                                   histogram=args.poisson_test, cache=not args.no_cache, cache_dir=args.cache_dir)
+    names = column_names(len(stats.count))
+
+    if len(per_file) > 1:
+        print(f"--- Per-File Results ({len(per_file)} files) ---")
+        print_file_table(per_file, names)
+        print("\n")
+
+    # --- Display Results (Now using clean names) ---
+    summary = stats.summary()
+    for i, name in enumerate(names):
+        if i:
+            print("\n")
+        print_summary(name, {key: values[i] for key, values in summary.items()})
+
+    if args.poisson_test:
+        print("\n")
+        print_poisson_report(names, poisson_report(stats, args.alpha), args.alpha)
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,433 @@
-from IPython.display import clear_output 
+import heapq
+import os
+import shutil
+import sys
+import numpy as np
 
 # roguelike Room Objects - write your code here
 
-#Take Room Dimensions
-width = int(input("Enter room width"))
-height = int(input("Enter room height"))
+def clear_screen():
+    """Clears the notebook output with IPython, or the terminal if IPython is not installed."""
+    # Imported here: IPython is optional and slow to import
+    try:
+        from IPython.display import clear_output
+    except ImportError:
+        os.system('cls' if os.name == 'nt' else 'clear')
+    else:
+        clear_output()
+
+# --- Sparse Chunked Tile Map ---
+
+# Tile codes stored in the map (anything but WALL can be walked on)
+FLOOR, WALL, ITEM = 0, 1, 2
+TILE_TEXT = {FLOOR: ". ", WALL: "# ", ITEM: "* "}
+
+class TileMap:
+    """
+    Walls and items of a (possibly huge) map, stored sparsely as square NumPy chunks of
+    chunk_size x chunk_size tiles in a dict keyed by chunk coordinates. A chunk is only
+    created when it is first looked at: loader(cx, cy) may supply its tiles (e.g. from
+    disk or a generator) or return None for plain floor, which is not stored at all.
+    Every edit is reported to the on_edit callbacks with the chunk it touched.
+    """
+
+    def __init__(self, chunk_size=64, loader=None):
+        if chunk_size & (chunk_size - 1):
+            raise ValueError("chunk_size must be a power of two")
+        self.chunk_size = chunk_size
+        self.shift = chunk_size.bit_length() - 1
+        self.loader = loader
+        self.chunks = {}      # (cx, cy) -> uint8 array, or None for an all-floor chunk
+        self.on_edit = []
+
+    def chunk_key(self, x, y):
+        return x >> self.shift, y >> self.shift
+
+    def chunk(self, key):
+        """The tile array of a chunk (None if it is all floor), loading it on first use."""
+        try:
+            return self.chunks[key]
+        except KeyError:
+            tiles = self.loader(*key) if self.loader else None
+            if tiles is not None:
+                tiles = np.ascontiguousarray(tiles, dtype=np.uint8)
+            self.chunks[key] = tiles
+            return tiles
+
+    def get(self, x, y):
+        tiles = self.chunk(self.chunk_key(x, y))
+        mask = self.chunk_size - 1
+        return FLOOR if tiles is None else int(tiles[y & mask, x & mask])
+
+    def is_wall(self, x, y):
+        return self.get(x, y) == WALL
+
+    def set(self, x, y, tile):
+        """Places a tile and notifies the on_edit callbacks of the chunk it is in."""
+        key = self.chunk_key(x, y)
+        tiles = self.chunk(key)
+        if tiles is None:
+            if tile == FLOOR:
+                return
+            tiles = self.chunks[key] = np.zeros((self.chunk_size, self.chunk_size), dtype=np.uint8)
+        mask = self.chunk_size - 1
+        tiles[y & mask, x & mask] = tile
+        for callback in self.on_edit:
+            callback(key)
+
+def random_wall_loader(wall_fraction, seed=0, chunk_size=64):
+    """Loader that generates walls on demand: each chunk has its own seeded random stream."""
+    def load(cx, cy):
+        rng = np.random.default_rng((seed, cx, cy))
+        return (rng.random((chunk_size, chunk_size)) < wall_fraction).astype(np.uint8) * WALL
+    return load
+
+# --- Hierarchical A* Pathfinding with a Chunk-Aware Path Cache ---
+
+# Chunk borders are split into segments this long. Each segment gets one portal (its
+# middle crossing) per pair of connected areas it joins, so scattered walls cannot
+# multiply the portals while every way across a border stays represented.
+PORTAL_SPACING = 16
+
+# Padding around start and goal of the square-by-square search used for nearby goals
+WINDOW_MARGIN = 32
+
+_START, _GOAL = -1, -2   # sentinel nodes of the portal graph search
+
+class PathFinder:
+    """
+    Shortest 4-connected paths on a width x height TileMap by hierarchical A*.
+
+    Each chunk is summarised once: its portals (the squares where a walkable gap in a
+    border with a neighbouring chunk can be crossed) and the walking distances between
+    them inside the chunk, found by breadth-first searches in scipy.sparse.csgraph. A
+    query links the start and goal to the portals of their chunks, runs A* (Manhattan
+    heuristic) over the portal graph instead of over single squares, then expands each
+    hop back into squares. Paths are shortest on the portal graph, which is usually
+    within a few percent of the true shortest path. Goals within a chunk of the start
+    are also searched square by square in a window around both ends (plain A*), so
+    short trips across a chunk border do not detour through a portal.
+
+    Chunk summaries and finished paths are both cached. A tile edit discards the
+    summaries of its chunk and the four chunks sharing its borders, and only those
+    cached paths whose search consulted one of these chunks.
+    """
+
+    def __init__(self, tiles, width, height, max_cached=10000):
+        self.tiles = tiles
+        self.width, self.height = width, height
+        self.n_chunks_x = -(-width // tiles.chunk_size)
+        self.n_chunks_y = -(-height // tiles.chunk_size)
+        self.max_cached = max_cached
+        self.summaries = {}   # chunk -> summary dict (see _summarise)
+        self.cache = {}       # (start, goal) -> (path or None, chunks consulted)
+        self.by_chunk = {}    # chunk -> cache keys that consulted it
+        self.hits = self.misses = 0
+        tiles.on_edit.append(self.invalidate_chunk)
+
+    # --- Cache maintenance ---
+
+    def invalidate_chunk(self, key):
+        cx, cy = key
+        for affected in (key, (cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
+            self.summaries.pop(affected, None)
+            for cache_key in self.by_chunk.pop(affected, ()):
+                self._forget(cache_key)
+
+    def _forget(self, cache_key):
+        entry = self.cache.pop(cache_key, None)
+        if entry is not None:
+            for chunk in entry[1]:
+                keys = self.by_chunk.get(chunk)
+                if keys is not None:
+                    keys.discard(cache_key)
+
+    def find_path(self, start, goal):
+        """List of (x, y) squares from start to goal inclusive, or None if there is no path."""
+        cache_key = (start, goal)
+        entry = self.cache.get(cache_key)
+        if entry is not None:
+            self.hits += 1
+            return list(entry[0]) if entry[0] is not None else None
+        self.misses += 1
+
+        consulted = set()
+        path = self._search(start, goal, consulted)
+        if len(self.cache) >= self.max_cached:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._forget(next(iter(self.cache)))
+        self.cache[cache_key] = (path, frozenset(consulted))
+        for chunk in consulted:
+            self.by_chunk.setdefault(chunk, set()).add(cache_key)
+        return list(path) if path is not None else None
+
+    # --- Chunk summaries ---
+
+    def _walkable(self, key):
+        """Boolean grid (rows are y) of the chunk's walkable squares, clipped to the map."""
+        size = self.tiles.chunk_size
+        cx, cy = key
+        w, h = min(size, self.width - cx * size), min(size, self.height - cy * size)
+        tiles = self.tiles.chunk(key)
+        if tiles is None:
+            return np.ones((h, w), dtype=bool)
+        return tiles[:h, :w] != WALL
+
+    def _areas(self, key):
+        """Connected walkable areas of a chunk (scipy.ndimage labels, 0 for walls)."""
+        from scipy.ndimage import label
+        return label(self._walkable(key))[0]
+
+    def _crossings(self, a, b, areas_a, areas_b):
+        """Portal square pairs (in a, in b) across the border of chunk a with chunk b to its east or south."""
+        size = self.tiles.chunk_size
+        if b[0] == a[0] + 1:
+            side_a, side_b = areas_a[:, -1], areas_b[:, 0]
+            x, y0 = a[0] * size + areas_a.shape[1] - 1, a[1] * size
+            make = lambda i: ((x, y0 + i), (x + 1, y0 + i))
+        else:
+            side_a, side_b = areas_a[-1, :], areas_b[0, :]
+            x0, y = a[0] * size, a[1] * size + areas_a.shape[0] - 1
+            make = lambda i: ((x0 + i, y), (x0 + i, y + 1))
+        groups = {}
+        for i in np.flatnonzero((side_a > 0) & (side_b > 0)).tolist():
+            groups.setdefault((i // PORTAL_SPACING, side_a[i], side_b[i]), []).append(i)
+        return [make(crossings[len(crossings) // 2]) for crossings in groups.values()]
+
+    def _summarise(self, key):
+        """
+        Portals of a chunk, the squares across the border each one leads to, and the
+        in-chunk distances (and BFS predecessors, for expanding hops into squares)
+        from every portal.
+        """
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import shortest_path
+
+        size = self.tiles.chunk_size
+        cx, cy = key
+        areas = self._areas(key)
+        walk = areas > 0
+        h, w = walk.shape
+
+        # 4-connected grid graph of the chunk's walkable squares (local index row * w + col)
+        index = np.arange(h * w).reshape(h, w)
+        right = walk[:, :-1] & walk[:, 1:]
+        down = walk[:-1, :] & walk[1:, :]
+        rows = np.concatenate([index[:, :-1][right], index[:-1, :][down]])
+        cols = np.concatenate([index[:, 1:][right], index[1:, :][down]])
+        graph = coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(h * w, h * w)).tocsr()
+
+        # Portals on all four sides, each with the squares it crosses to
+        exits = {}
+        neighbours = ((cx + 1, cy, False), (cx, cy + 1, False), (cx - 1, cy, True), (cx, cy - 1, True))
+        for nx, ny, before in neighbours:
+            if not (0 <= nx < self.n_chunks_x and 0 <= ny < self.n_chunks_y):
+                continue
+            other = (nx, ny)
+            if before:
+                pairs = [(inside, outside) for outside, inside
+                         in self._crossings(other, key, self._areas(other), areas)]
+            else:
+                pairs = self._crossings(key, other, areas, self._areas(other))
+            for (px, py), (qx, qy) in pairs:
+                exits.setdefault(py * self.width + px, []).append(qy * self.width + qx)
+
+        portals = list(exits)
+        local = [(cell // self.width - cy * size) * w + cell % self.width - cx * size for cell in portals]
+        if local:
+            dist, pred = shortest_path(graph, directed=False, unweighted=True, indices=local,
+                                       return_predecessors=True)
+        else:
+            dist, pred = np.zeros((0, h * w)), np.zeros((0, h * w), dtype=np.int32)
+        return {
+            'origin': (cx * size, cy * size), 'w': w, 'graph': graph,
+            'portals': portals, 'local': local,
+            'position': {cell: i for i, cell in enumerate(portals)},
+            # Every edge out of each portal as a plain (cell, cost) list for the search's
+            # inner loop: the other portals it can walk to, then the squares it crosses to
+            'links': {cell: [(other, int(d)) for other, d in zip(portals, row[local].tolist())
+                             if d != np.inf and other != cell] + [(other, 1) for other in exits[cell]]
+                      for cell, row in zip(portals, dist)},
+            'pred': pred,
+        }
+
+    def _summary(self, key, consulted):
+        consulted.add(key)
+        summary = self.summaries.get(key)
+        if summary is None:
+            summary = self.summaries[key] = self._summarise(key)
+        return summary
+
+    # --- Query ---
+
+    def _local_walk(self, summary, pred_row, source_local, target_local):
+        """Squares from target back to source along one BFS predecessor row, as global (x, y)."""
+        (x0, y0), w = summary['origin'], summary['w']
+        squares = []
+        node = target_local
+        while node != source_local:
+            squares.append((x0 + node % w, y0 + node // w))
+            node = int(pred_row[node])
+            if node < 0:
+                return None
+        squares.append((x0 + source_local % w, y0 + source_local // w))
+        return squares
+
+    def _search(self, start, goal, consulted):
+        (sx, sy), (gx, gy) = start, goal
+        for x, y in (start, goal):
+            if not (0 <= x < self.width and 0 <= y < self.height) or self.tiles.is_wall(x, y):
+                return None
+
+        # The portal route has to pass through border portals, which is a long detour
+        # for nearby squares on either side of a chunk border. For goals within a chunk
+        # of the start, search square by square around both ends as well and keep the shorter path.
+        window_path = None
+        size = self.tiles.chunk_size
+        if abs(gx - sx) <= size and abs(gy - sy) <= size:
+            window_path = self._window_search(start, goal, consulted)
+            if window_path is not None and len(window_path) - 1 == abs(gx - sx) + abs(gy - sy):
+                return window_path   # as short as possible already
+        portal_path = self._portal_search(start, goal, consulted)
+        if window_path is None or (portal_path is not None and len(portal_path) < len(window_path)):
+            return portal_path
+        return window_path
+
+    def _window_search(self, start, goal, consulted):
+        """Cell-level A* confined to the bounding box of start and goal padded by WINDOW_MARGIN."""
+        size, shift = self.tiles.chunk_size, self.tiles.shift
+        (sx, sy), (gx, gy) = start, goal
+        x0, x1 = max(0, min(sx, gx) - WINDOW_MARGIN), min(self.width, max(sx, gx) + WINDOW_MARGIN + 1)
+        y0, y1 = max(0, min(sy, gy) - WINDOW_MARGIN), min(self.height, max(sy, gy) + WINDOW_MARGIN + 1)
+
+        # Walkable squares of the window, copied out of the chunks it overlaps
+        walk = np.zeros((y1 - y0, x1 - x0), dtype=bool)
+        for cy in range(y0 >> shift, ((y1 - 1) >> shift) + 1):
+            for cx in range(x0 >> shift, ((x1 - 1) >> shift) + 1):
+                consulted.add((cx, cy))
+                chunk = self._walkable((cx, cy))
+                ax0, ax1 = max(x0, cx * size), min(x1, cx * size + chunk.shape[1])
+                ay0, ay1 = max(y0, cy * size), min(y1, cy * size + chunk.shape[0])
+                walk[ay0 - y0:ay1 - y0, ax0 - x0:ax1 - x0] = \
+                    chunk[ay0 - cy * size:ay1 - cy * size, ax0 - cx * size:ax1 - cx * size]
+        walkable = walk.ravel().tolist()
+
+        w, n = x1 - x0, walk.size
+        target = (gy - y0) * w + gx - x0
+        tx, ty = gx - x0, gy - y0
+        source = (sy - y0) * w + sx - x0
+        h = abs(gx - sx) + abs(gy - sy)
+        heap, g_score, parent = [(h, h, source)], {source: 0}, {source: -1}
+        while heap:
+            f, h, i = heapq.heappop(heap)
+            if i == target:
+                path = []
+                while i >= 0:
+                    path.append((x0 + i % w, y0 + i // w))
+                    i = parent[i]
+                return path[::-1]
+            g = f - h
+            if g > g_score[i]:
+                continue   # stale heap entry
+            x = i % w
+            for j, inside in ((i - 1, x > 0), (i + 1, x < w - 1), (i - w, i >= w), (i + w, i + w < n)):
+                if inside and walkable[j]:
+                    new_g = g + 1
+                    if new_g < g_score.get(j, new_g + 1):
+                        g_score[j] = new_g
+                        parent[j] = i
+                        h = abs(tx - j % w) + abs(ty - j // w)
+                        heapq.heappush(heap, (new_g + h, h, j))
+        return None
+
+    def _portal_search(self, start, goal, consulted):
+        """Hierarchical A* over the portal graph, expanded back into squares."""
+        from scipy.sparse.csgraph import shortest_path
+
+        width, shift = self.width, self.tiles.shift
+        (sx, sy), (gx, gy) = start, goal
+
+        def chunk_of(cell):
+            return (cell % width) >> shift, (cell // width) >> shift
+
+        def local_of(summary, x, y):
+            return (y - summary['origin'][1]) * summary['w'] + x - summary['origin'][0]
+
+        # Breadth-first searches from the start and the goal inside their own chunks
+        start_chunk, goal_chunk = (sx >> shift, sy >> shift), (gx >> shift, gy >> shift)
+        s_sum, g_sum = self._summary(start_chunk, consulted), self._summary(goal_chunk, consulted)
+        s_local, g_local = local_of(s_sum, sx, sy), local_of(g_sum, gx, gy)
+        s_dist, s_pred = shortest_path(s_sum['graph'], directed=False, unweighted=True, indices=s_local,
+                                       return_predecessors=True)
+        g_dist, g_pred = shortest_path(g_sum['graph'], directed=False, unweighted=True, indices=g_local,
+                                       return_predecessors=True)
+        start_links = [(cell, int(s_dist[i])) for cell, i in zip(s_sum['portals'], s_sum['local'])
+                       if s_dist[i] != np.inf]
+        goal_links = {cell: int(g_dist[i]) for cell, i in zip(g_sum['portals'], g_sum['local'])
+                      if g_dist[i] != np.inf}
+        direct = s_dist[g_local] if start_chunk == goal_chunk else np.inf
+
+        # A start or goal walled into a pocket of its chunk is only reachable from inside it
+        if not (start_links and goal_links):
+            if direct == np.inf:
+                return None
+            return self._local_walk(s_sum, s_pred, s_local, g_local)[::-1]
+
+        # A* over portals; g_score/parent also hold the _START and _GOAL sentinels
+        heap, g_score, parent = [], {_START: 0}, {}
+        if direct != np.inf:
+            g_score[_GOAL] = direct
+            parent[_GOAL] = _START
+            heapq.heappush(heap, (direct, 0, _GOAL))
+        for cell, d in start_links:
+            g_score[cell] = d
+            parent[cell] = _START
+            h = abs(gx - cell % width) + abs(gy - cell // width)
+            heapq.heappush(heap, (d + h, h, cell))
+
+        while heap:
+            f, h, node = heapq.heappop(heap)
+            if node == _GOAL:
+                break
+            g = f - h
+            if g > g_score[node]:
+                continue   # stale heap entry
+            chunk = chunk_of(node)
+            links = self._summary(chunk, consulted)['links'][node]
+            if chunk == goal_chunk and node in goal_links:
+                links = links + [(_GOAL, goal_links[node])]
+            for other, d in links:
+                new_g = g + d
+                if new_g < g_score.get(other, new_g + 1):
+                    g_score[other] = new_g
+                    parent[other] = node
+                    h = 0 if other == _GOAL else abs(gx - other % width) + abs(gy - other // width)
+                    heapq.heappush(heap, (new_g + h, h, other))
+        else:
+            return None
+
+        # Expand the chain of portals back into squares
+        hops = [_GOAL]
+        while hops[-1] != _START:
+            hops.append(parent[hops[-1]])
+        hops.reverse()
+        path = []
+        for a, b in zip(hops, hops[1:]):
+            if a == _START and b == _GOAL:
+                segment = self._local_walk(s_sum, s_pred, s_local, g_local)[::-1]
+            elif a == _START:
+                segment = self._local_walk(s_sum, s_pred, s_local, local_of(s_sum, b % width, b // width))[::-1]
+            elif b == _GOAL:
+                segment = self._local_walk(g_sum, g_pred, g_local, local_of(g_sum, a % width, a // width))
+            elif chunk_of(a) != chunk_of(b):
+                segment = [(a % width, a // width), (b % width, b // width)]
+            else:
+                summary = self.summaries[chunk_of(a)]
+                i = summary['position'][a]
+                segment = self._local_walk(summary, summary['pred'][i], summary['local'][i],
+                                           local_of(summary, b % width, b // width))[::-1]
+            path.extend(segment[1:] if path else segment)
+        return path
 
 #Initialise Room Class
 
@@ -13,106 +436,226 @@ class Room:
     """
     Represents a 2D room with defined dimensions and a user's location.
     """    
-    def __init__(self, width, height):
+    def __init__(self, width, height, tiles=None):
                 
         """
         Initializes the Room object with a given width and height,
         and sets the user's starting position (x, y) to (0, 0).
+        Walls and items come from `tiles` (an empty TileMap if not given).
         """
     
         #Define Room Size
         self.width = width
         self.height = height
+
+        # Map data and pathfinding over it (paths are cached until the map is edited)
+        self.tiles = tiles if tiles is not None else TileMap()
+        self.pathfinder = PathFinder(self.tiles, width, height)
         
         # Define the user's current location (class variables x, y)
         self.x = 0
         self.y = 0
+
+        # Feedback from the last move, shown under the room
+        self.message = ""
+
+    def cell(self, x, y):
+        """Two-character text of the square at (x, y): 'P ' for the user, else its tile ('. ', '# ' or '* ')."""
+        return "P " if x == self.x and y == self.y else TILE_TEXT[self.tiles.get(x, y)]
+
+    def find_path(self, x, y):
+        """Shortest list of squares from the user to (x, y), or None if walls cut it off."""
+        return self.pathfinder.find_path((self.x, self.y), (x, y))
     
         #Initialise Draw Function Within Class    
     
     def draw(self):
         
         """
-        Clears the console and draws the room grid, marking the user's position.
+        Clears the output and draws the whole room grid, marking the user's position.
+        Used in notebooks; terminals use TerminalRenderer, which only redraws changes.
         """
     
-        clear_output()
-        print(f"Current Room: {self.width}x{self.height} Grid")
-        print("-" * (self.width * 2 + 1)) #Border line
+        clear_screen()
+        lines = [f"Current Room: {self.width}x{self.height} Grid"]
+        lines.append("-" * (self.width * 2 + 2)) #Border line
     
-        #Outer loop iterates through rows (y-coordinate)
+        #Each row (y-coordinate) is built with one join rather than repeated concatenation
         for y_coord in range(self.height):
-            row_output = "|"
-    
-            for x_coord in range(self.width):
-    
-                if x_coord == self.x and y_coord == self.y:
-                    row_output += "P"
-    
-                else:
-                    # Print '.' for an empty space
-                    row_output += ". "
-    
-            row_output += "|" # End of the row
-    
-            print(row_output)
+            lines.append("|" + "".join(self.cell(x_coord, y_coord) for x_coord in range(self.width)) + "|")
+
+        lines.append("-" * (self.width * 2 + 2))
+        lines.append(self.message)
+        print("\n".join(lines))
 
     #Left Check
     def left(self):
         new_x = self.x - 1
         
         # Check if the new X is still 0 or greater
-        if new_x >= 0:
+        if new_x >= 0 and self.tiles.is_wall(new_x, self.y):
+            self.message = "Movement blocked: Hit a wall!"
+        elif new_x >= 0:
             self.x = new_x
             # Optional: Update a status message for feedback
             self.message = "Moved left."
         else:
-            print("Movement blocked: Hit the west wall!")
+            self.message = "Movement blocked: Hit the west wall!"
 
         #Right Check
     def right(self):
         new_x = self.x + 1
         
-        # Check if the new X is still 0 or greater
-        if new_x < self.width:
+        # Check if the new X is still inside the room
+        if new_x < self.width and self.tiles.is_wall(new_x, self.y):
+            self.message = "Movement blocked: Hit a wall!"
+        elif new_x < self.width:
             self.x = new_x
             # Optional: Update a status message for feedback
             self.message = "Moved right."
         else:
-            print("Movement blocked: Hit the east wall!")
+            self.message = "Movement blocked: Hit the east wall!"
 
     #Up Check
     def up(self):
             new_y = self.y - 1
             
             # Boundary Check: Check if the new Y is 0 or greater. (The top boundary)
-            if new_y >= 0:
+            if new_y >= 0 and self.tiles.is_wall(self.x, new_y):
+                self.message = "Movement blocked: Hit a wall!"
+            elif new_y >= 0:
                 self.y = new_y
                 self.message = "Moved up."
             else:
-                print("Movement blocked: Hit the north wall!")
+                self.message = "Movement blocked: Hit the north wall!"
 
     #Down Check
     def down(self):
         new_y = self.y + 1
         
-        # Boundary Check: Check if the new Y is 0 or greater. (The top boundary)
-        if new_y < self.height:
+        # Boundary Check: Check if the new Y is still inside the room. (The bottom boundary)
+        if new_y < self.height and self.tiles.is_wall(self.x, new_y):
+            self.message = "Movement blocked: Hit a wall!"
+        elif new_y < self.height:
             self.y = new_y
             self.message = "Moved down."
         else:
-            print("Movement blocked: Hit the south wall!")
-        
-myRoom = Room(width,height)
-myRoom.draw()
-
-while True:
-    s = input()
-    if s=='a': myRoom.left()
-    if s=='s': myRoom.right()
-    if s=='q': myRoom.up()
-    if s=='z': myRoom.down()
-    if s=='x': 
-        print("all done")
-        break
-    myRoom.draw()
+            self.message = "Movement blocked: Hit the south wall!"
+
+# --- Incremental Terminal Renderer ---
+
+class TerminalRenderer:
+    """
+    Draws a Room in a terminal using ANSI cursor addressing, redrawing only what changed.
+
+    The text of every cell on screen is cached in a frame buffer. After a move only the
+    user's old and new squares can differ, so a frame costs two cell updates and the
+    status line whatever the room size, and it is sent to the terminal in one write.
+    Rooms larger than the terminal are shown through a viewport that recentres on the
+    user when they walk off its edge (the only time the whole view is redrawn).
+    """
+
+    HEADER_LINES = 2   # title and top border, above the first row of cells
+
+    def __init__(self, room, out=None, view_width=None, view_height=None):
+        self.room = room
+        self.out = out or sys.stdout
+        columns, lines = shutil.get_terminal_size()
+        # Leave space for the side borders, and for the title, both borders, status and prompt lines
+        self.view_width = min(room.width, view_width or max(1, (columns - 2) // 2))
+        self.view_height = min(room.height, view_height or max(1, lines - 6))
+        self.left = self.top = 0   # room coordinates of the viewport's top-left square
+        self.frame = None          # cell text currently on screen, one list per viewport row
+        self.drawn_user = None     # user position in the last frame
+        self.status = None
+
+    def _goto(self, line, column):
+        return f"\x1b[{line};{column}H"
+
+    def _follow_user(self):
+        """Recentres the viewport on the user if they have left it; True if it moved."""
+        room = self.room
+        left, top = self.left, self.top
+        if not left <= room.x < left + self.view_width:
+            left = min(max(0, room.x - self.view_width // 2), room.width - self.view_width)
+        if not top <= room.y < top + self.view_height:
+            top = min(max(0, room.y - self.view_height // 2), room.height - self.view_height)
+        moved = (left, top) != (self.left, self.top)
+        self.left, self.top = left, top
+        return moved
+
+    def _full_frame(self, parts):
+        room = self.room
+        title = f"Current Room: {room.width}x{room.height} Grid"
+        if (self.view_width, self.view_height) != (room.width, room.height):
+            title += f" (showing x {self.left}-{self.left + self.view_width - 1}, y {self.top}-{self.top + self.view_height - 1})"
+        border = "-" * (self.view_width * 2 + 2)
+        self.frame = [[room.cell(x, y) for x in range(self.left, self.left + self.view_width)]
+                      for y in range(self.top, self.top + self.view_height)]
+        parts.append("\x1b[H\x1b[2J")   # home the cursor and clear the screen
+        parts.append("\n".join([title, border] + ["|" + "".join(row) + "|" for row in self.frame] + [border]))
+        self.status = None
+
+    def _update_cell(self, parts, x, y):
+        """Queues a redraw of square (x, y) if it is in view and its text changed; True if queued."""
+        row, col = y - self.top, x - self.left
+        if not (0 <= row < self.view_height and 0 <= col < self.view_width):
+            return False
+        text = self.room.cell(x, y)
+        if self.frame[row][col] == text:
+            return False
+        self.frame[row][col] = text
+        parts.append(self._goto(self.HEADER_LINES + 1 + row, 2 + 2 * col) + text)
+        return True
+
+    def render(self):
+        """Brings the screen up to date with a single write; returns the number of cells redrawn."""
+        parts = []
+        room = self.room
+        if self._follow_user() or self.frame is None:
+            self._full_frame(parts)
+            redrawn = self.view_width * self.view_height
+        else:
+            # Only the user's previous and current squares can have changed
+            redrawn = sum(self._update_cell(parts, x, y) for x, y in (self.drawn_user, (room.x, room.y)))
+        self.drawn_user = (room.x, room.y)
+
+        status_line = self.HEADER_LINES + self.view_height + 2
+        if room.message != self.status:
+            parts.append(self._goto(status_line, 1) + room.message + "\x1b[K")
+            self.status = room.message
+        # Park the cursor on a cleared line below for the next input() prompt
+        parts.append(self._goto(status_line + 1, 1) + "\x1b[K")
+
+        self.out.write("".join(parts))
+        self.out.flush()
+        return redrawn
+
+# --- Main Loop ---
+
+def main():
+    """Asks for the room size, then moves the user with a/s/q/z until x is entered."""
+    #Take Room Dimensions
+    width = int(input("Enter room width"))
+    height = int(input("Enter room height"))
+
+    myRoom = Room(width,height)
+
+    # ANSI cursor addressing needs a real terminal; notebooks redraw the whole room instead
+    renderer = TerminalRenderer(myRoom) if sys.stdout.isatty() else None
+    draw = renderer.render if renderer else myRoom.draw
+    draw()
+
+    while True:
+        s = input()
+        if s=='a': myRoom.left()
+        if s=='s': myRoom.right()
+        if s=='q': myRoom.up()
+        if s=='z': myRoom.down()
+        if s=='x':
+            print("all done")
+            break
+        draw()
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,15 @@
-from random import seed
-from random import randint 
-from IPython.display import display, clear_output
 import os 
-import time # **Required for the computer's 'thinking' delay**
+import random
+import time
 
 # --- 1. SETUP ---
 
-# Initialize the 3x3 game board using a list of lists.
-board = [
-    ['.', '.', '.'],  # Row 0 (7, 8, 9)
-    ['.', '.', '.'],  # Row 1 (4, 5, 6)
-    ['.', '.', '.']   # Row 2 (1, 2, 3)
-]
+def new_board(width=3, height=3):
+    """Returns an empty game board (3x3 by default) as a list of lists."""
+    # For 3x3: Row 0 is keys (7, 8, 9), Row 1 (4, 5, 6), Row 2 (1, 2, 3)
+    return [['.'] * width for _ in range(height)]
 
-# MAX_SQUARES is defined here (9 total squares)
+# MAX_SQUARES is defined here (9 total squares on the classic 3x3 board)
 MAX_SQUARES = 9 
 
 def print_board(current_board):
@@ -21,70 +17,481 @@ def print_board(current_board):
     for row in current_board:
         print(' '.join(row))
 
+def clear_screen():
+    """Clears the notebook output with IPython, or the terminal if IPython is not installed."""
+    # Imported here: IPython is optional and slow to import, and headless runs never need it
+    try:
+        from IPython.display import clear_output
+    except ImportError:
+        os.system('cls' if os.name == 'nt' else 'clear') 
+    else:
+        clear_output(wait=True)
+
 # --- 2. COORDINATE FORMULA (Computer Keypad) ---
 
-def number_to_coords(number):
-    """Converts a 1-9 number (computer keypad layout) to (row, col) indices."""
-    if not 1 <= number <= 9:
+def number_to_coords(number, width=3, height=3):
+    """
+    Converts a square number (computer keypad layout: 1 is bottom-left, numbers run
+    left to right, then upwards) to (row, col) indices. 1-9 on the 3x3 board.
+    """
+    if not 1 <= number <= width * height:
         return None, None
         
     zero_based_index = number - 1
     
-    # Row Formula: 2 - floor((N-1)/3)
-    row = 2 - (zero_based_index // 3)
+    # Row Formula: (height - 1) - floor((N-1)/width)
+    row = (height - 1) - (zero_based_index // width)
     
-    # Column Formula: (N-1) % 3
-    col = zero_based_index % 3
+    # Column Formula: (N-1) % width
+    col = zero_based_index % width
     
     return row, col
 
 # --- 3. WIN CHECKING LOGIC ---
 
-def check_win(current_board, marker):
-    """Checks if the specified marker ('X' or 'O') has won (all 8 lines)."""
-    
-    # Check Rows (3 combinations)
-    for r in range(3):
-        if all(current_board[r][c] == marker for c in range(3)):
-            return True
+# Each player's markers are stored as a 9-bit integer: bit (row * 3 + col) is set when
+# that player occupies the square, so a line is complete when all three of its bits are.
+FULL_BOARD = 0b111111111
+
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # Rows 0, 1, 2
+    0b001001001, 0b010010010, 0b100100100,  # Columns 0, 1, 2
+    0b100010001, 0b001010100,               # Diagonals
+)
 
-    # Check Columns (3 combinations)
-    for c in range(3):
-        if all(current_board[r][c] == marker for r in range(3)):
+def is_win(bits):
+    """True if the bitboard contains a complete line."""
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
             return True
+    return False
 
-    # Check Diagonals (2 combinations)
-    
-    # Diagonal 1: Top-Left to Bottom-Right
-    if (current_board[0][0] == marker and
-        current_board[1][1] == marker and
-        current_board[2][2] == marker):
-        return True
-        
-    # Diagonal 2: Top-Right to Bottom-Left
-    if (current_board[0][2] == marker and
-        current_board[1][1] == marker and
-        current_board[2][0] == marker):
-        return True
+def board_to_bits(current_board, marker):
+    """Converts the list-of-lists board to (marker's bits, opponent's bits), bit row * width + col."""
+    width = len(current_board[0])
+    mine = theirs = 0
+    for r, row in enumerate(current_board):
+        for c, square in enumerate(row):
+            if square == marker:
+                mine |= 1 << (r * width + c)
+            elif square != '.':
+                theirs |= 1 << (r * width + c)
+    return mine, theirs
+
+# The four line directions through a square: horizontal, vertical and both diagonals
+LINE_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
 
+def check_win(current_board, marker, last_move=None, k=3):
+    """
+    Checks if the specified marker ('X' or 'O') has k in a row. Given the (row, col) of
+    the last move, only the four lines through that square are examined; otherwise the
+    whole board is checked (all 8 lines on the classic 3x3 board).
+    """
+    height, width = len(current_board), len(current_board[0])
+    if last_move is None:
+        if (width, height, k) == (3, 3, 3):
+            return is_win(board_to_bits(current_board, marker)[0])
+        return any(check_win(current_board, marker, (r, c), k)
+                   for r in range(height) for c in range(width) if current_board[r][c] == marker)
+
+    r, c = last_move
+    for dr, dc in LINE_DIRECTIONS:
+        # Count the unbroken run through (r, c) in both directions along the line
+        run = 1
+        for sign in (1, -1):
+            rr, cc = r + sign * dr, c + sign * dc
+            while 0 <= rr < height and 0 <= cc < width and current_board[rr][cc] == marker:
+                run += 1
+                rr, cc = rr + sign * dr, cc + sign * dc
+        if run >= k:
+            return True
     return False
 
+# --- 3B. PERFECT-PLAY ENGINE (Alpha-Beta Negamax) ---
+
+def _square_map(transform):
+    """Permutation of square indices for a board symmetry given as (r, c) -> (r', c')."""
+    return tuple(3 * r2 + c2 for r2, c2 in (transform(i // 3, i % 3) for i in range(9)))
+
+# The 8 symmetries of the square (rotations and reflections)
+SYMMETRIES = tuple(_square_map(transform) for transform in (
+    lambda r, c: (r, c),
+    lambda r, c: (c, 2 - r),
+    lambda r, c: (2 - r, 2 - c),
+    lambda r, c: (2 - c, r),
+    lambda r, c: (r, 2 - c),
+    lambda r, c: (2 - r, c),
+    lambda r, c: (c, r),
+    lambda r, c: (2 - c, 2 - r),
+))
+
+# SYMMETRY_TABLES[s][bits] is the bitboard `bits` transformed by symmetry s
+SYMMETRY_TABLES = tuple(
+    tuple(sum(1 << perm[i] for i in range(9) if bits >> i & 1) for bits in range(512))
+    for perm in SYMMETRIES
+)
+
+# Centre first, then corners, then edges: the strongest moves are searched first,
+# which makes alpha-beta cut-offs happen early
+MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+# Transposition table: canonical position -> (score, bound type)
+TRANSPOSITIONS = {}
+
+# Best move per canonical position, in the canonical orientation
+BEST_MOVES = {}
+
+def canonical(mine, theirs):
+    """
+    Smallest key (mine | theirs << 9) over the 8 symmetries, and the symmetry that gives
+    it. All symmetric positions share one key, so each is only searched once.
+    """
+    return min((table[mine] | table[theirs] << 9, s) for s, table in enumerate(SYMMETRY_TABLES))
+
+def negamax(mine, theirs, alpha=-10, beta=10):
+    """
+    Score of the position for the player to move (`mine`) under perfect play by both
+    sides: 0 for a draw, otherwise the number of squares still empty after the winning
+    move (positive if `mine` wins), so quicker wins and slower losses score higher.
+    """
+    key = canonical(mine, theirs)[0]
+    entry = TRANSPOSITIONS.get(key)
+    if entry is not None:
+        score, bound = entry
+        if bound == EXACT:
+            return score
+        if bound == LOWER_BOUND:
+            alpha = max(alpha, score)
+        else:
+            beta = min(beta, score)
+        if alpha >= beta:
+            return score
+
+    empty = FULL_BOARD & ~(mine | theirs)
+    if not empty:
+        return 0
+
+    alpha_start = alpha
+    best = -10
+    for square in MOVE_ORDER:
+        bit = 1 << square
+        if not empty & bit:
+            continue
+        if is_win(mine | bit):
+            score = bin(empty).count('1')
+        else:
+            score = -negamax(theirs, mine | bit, -beta, -alpha)
+        if score > best:
+            best = score
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+
+    if best <= alpha_start:
+        TRANSPOSITIONS[key] = (best, UPPER_BOUND)
+    elif best >= beta:
+        TRANSPOSITIONS[key] = (best, LOWER_BOUND)
+    else:
+        TRANSPOSITIONS[key] = (best, EXACT)
+    return best
+
+def best_move(mine, theirs):
+    """
+    Perfect move (square index 0-8) for the player owning `mine`. Answers come from
+    BEST_MOVES once a position (or any symmetric one) has been solved.
+    """
+    key, s = canonical(mine, theirs)
+    move = BEST_MOVES.get(key)
+    if move is None:
+        # Solve the canonical orientation, so the answer serves all 8 symmetric positions
+        c_mine, c_theirs = key & FULL_BOARD, key >> 9
+        empty = FULL_BOARD & ~(c_mine | c_theirs)
+        best_score = -11
+        for square in MOVE_ORDER:
+            bit = 1 << square
+            if not empty & bit:
+                continue
+            if is_win(c_mine | bit):
+                score = bin(empty).count('1')
+            else:
+                score = -negamax(c_theirs, c_mine | bit)
+            if score > best_score:
+                best_score, move = score, square
+        BEST_MOVES[key] = move
+    # Map the square back from the canonical orientation
+    return SYMMETRIES[s].index(move)
+
+def warm_up():
+    """Solves every reachable position, so all later moves are table lookups."""
+    seen = set()
+    def visit(mine, theirs):
+        key = canonical(mine, theirs)[0]
+        if key in seen or is_win(theirs) or not FULL_BOARD & ~(mine | theirs):
+            return
+        seen.add(key)
+        best_move(mine, theirs)
+        empty = FULL_BOARD & ~(mine | theirs)
+        for square in range(9):
+            if empty >> square & 1:
+                visit(theirs, mine | 1 << square)
+    visit(0, 0)
+    return len(seen)
+
+# --- 3C. GENERAL m,n,k BOARDS (Iterative Deepening Search) ---
+
+# Score of a won position; wins found sooner score higher (WIN_SCORE - ply)
+WIN_SCORE = 10**9
+
+class MNKBoard:
+    """
+    A width x height board on which k in a row wins (Gomoku is 15 x 15 with k = 5).
+    Each player's stones are one Python integer bitboard (bit row * width + col), and
+    moves are made and undone in place, so the search never copies the board.
+    stones[to_move] always belongs to the player whose turn it is.
+    """
+
+    def __init__(self, width=3, height=3, k=3):
+        self.width, self.height, self.k = width, height, k
+        self.size = width * height
+        self.full = (1 << self.size) - 1
+        self.stones = [0, 0]
+        self.to_move = 0
+        self.history = []
+        self.winner = None   # index of the player with k in a row, once there is one
+
+        # Column masks so that shifting by one square does not wrap onto the next row
+        first_col = sum(1 << (r * width) for r in range(height))
+        self.not_first_col = self.full & ~first_col
+        self.not_last_col = self.full & ~(first_col << (width - 1))
+
+        # For each line direction: the bit offset between neighbouring squares and the
+        # mask of squares where a k-long window starts without leaving the board
+        self.windows = []
+        for dr, dc in LINE_DIRECTIONS:
+            starts = 0
+            for r in range(height):
+                for c in range(width):
+                    if 0 <= r + (k - 1) * dr < height and 0 <= c + (k - 1) * dc < width:
+                        starts |= 1 << (r * width + c)
+            self.windows.append((dr * width + dc, starts))
+
+    @classmethod
+    def from_lists(cls, current_board, marker, k=3):
+        """Board with `marker` ('X' or 'O') to move, from the list-of-lists board."""
+        board = cls(len(current_board[0]), len(current_board), k)
+        board.stones = list(board_to_bits(current_board, marker))
+        return board
+
+    def empty(self):
+        return self.full & ~(self.stones[0] | self.stones[1])
+
+    def play(self, square):
+        player = self.to_move
+        self.stones[player] |= 1 << square
+        self.history.append(square)
+        if self.completes_line(square, player):
+            self.winner = player
+        self.to_move ^= 1
+
+    def undo(self):
+        square = self.history.pop()
+        self.to_move ^= 1
+        self.stones[self.to_move] &= ~(1 << square)
+        self.winner = None
+
+    def completes_line(self, square, player):
+        """True if player's stone on `square` is part of k in a row (only the 4 lines through it are checked)."""
+        bits = self.stones[player]
+        r, c = divmod(square, self.width)
+        for dr, dc in LINE_DIRECTIONS:
+            run = 1
+            for sign in (1, -1):
+                rr, cc = r + sign * dr, c + sign * dc
+                while 0 <= rr < self.height and 0 <= cc < self.width and bits >> (rr * self.width + cc) & 1:
+                    run += 1
+                    rr, cc = rr + sign * dr, cc + sign * dc
+            if run >= self.k:
+                return True
+        return False
+
+    def wins_with(self, square, player):
+        """True if playing `square` would give player k in a row."""
+        self.stones[player] |= 1 << square
+        wins = self.completes_line(square, player)
+        self.stones[player] &= ~(1 << square)
+        return wins
+
+    def neighbourhood(self):
+        """Empty squares next to (including diagonally) any stone: the only moves searched."""
+        occupied = self.stones[0] | self.stones[1]
+        rows = occupied | (occupied << 1 & self.not_first_col) | (occupied >> 1 & self.not_last_col)
+        around = rows | rows << self.width | rows >> self.width
+        return around & self.empty()
+
+    def evaluate(self):
+        """
+        Heuristic score for the player to move. Every k-long window free of the opponent's
+        stones is worth 8**(stones in it - 1) to a player; window counts come from bit-sliced
+        adders over whole bitboards rather than a loop over squares.
+        """
+        score = 0
+        for player, sign in ((self.to_move, 1), (self.to_move ^ 1, -1)):
+            own, other = self.stones[player], self.stones[player ^ 1]
+            for shift, starts in self.windows:
+                free = starts
+                planes = []   # binary digits of the per-window stone count
+                for j in range(self.k):
+                    free &= ~(other >> (j * shift))
+                    carry = own >> (j * shift)
+                    for p, plane in enumerate(planes):
+                        planes[p], carry = plane ^ carry, plane & carry
+                    if carry:
+                        planes.append(carry)
+                for count in range(1, self.k):
+                    exact = free
+                    for p, plane in enumerate(planes):
+                        exact &= plane if count >> p & 1 else ~plane
+                    if count >> len(planes):
+                        exact = 0
+                    score += sign * 8**(count - 1) * bin(exact).count('1')
+        return score
+
+class _SearchTimeout(Exception):
+    pass
+
+class MNKSearch:
+    """
+    Iterative-deepening alpha-beta (negamax) search within a time budget. Moves are
+    ordered: transposition-table move, immediate wins, blocks of the opponent's immediate
+    wins, then by a history heuristic, so cut-offs come early and each deeper iteration
+    reuses what the shallower ones learned.
+    """
+
+    def __init__(self, board, time_budget=1.0, max_depth=None):
+        self.board = board
+        self.time_budget = time_budget
+        self.max_depth = max_depth or bin(board.empty()).count('1')
+        self.table = {}     # (stones to move, other stones) -> (depth, score, bound, best move)
+        self.history = {}   # square -> cut-off credit
+        self.nodes = 0
+        self.depth_reached = 0
+
+    def _squares(self, bits):
+        squares = []
+        while bits:
+            low = bits & -bits
+            squares.append(low.bit_length() - 1)
+            bits ^= low
+        return squares
+
+    def ordered_moves(self, first=None):
+        board = self.board
+        if not board.stones[0] | board.stones[1]:
+            # Empty board: open in the centre
+            return [(board.height // 2) * board.width + board.width // 2]
+        candidates = board.neighbourhood() or board.empty()
+        squares = self._squares(candidates)
+        player = board.to_move
+        wins = [sq for sq in squares if board.wins_with(sq, player)]
+        if wins:
+            return wins[:1]
+        blocks = [sq for sq in squares if board.wins_with(sq, player ^ 1)]
+        if blocks:
+            # Anything but blocking loses at once (and two threats cannot both be blocked)
+            return blocks[:1] if len(blocks) == 1 else blocks
+        squares.sort(key=lambda sq: self.history.get(sq, 0), reverse=True)
+        if first is not None and first in squares:
+            squares.remove(first)
+            squares.insert(0, first)
+        return squares
+
+    def negamax(self, depth, alpha, beta, ply):
+        self.nodes += 1
+        if self.nodes & 127 == 0 and time.perf_counter() > self.deadline:
+            raise _SearchTimeout
+        board = self.board
+        if board.winner is not None:
+            return -(WIN_SCORE - ply)
+        if not board.empty():
+            return 0
+        if depth == 0:
+            return board.evaluate()
+
+        key = (board.stones[board.to_move], board.stones[board.to_move ^ 1])
+        entry = self.table.get(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, score, bound, tt_move = entry
+            if entry_depth >= depth:
+                if bound == EXACT:
+                    return score
+                if bound == LOWER_BOUND:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        alpha_start = alpha
+        best, best_square = -WIN_SCORE - 1, None
+        for square in self.ordered_moves(tt_move):
+            board.play(square)
+            try:
+                score = -self.negamax(depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                board.undo()
+            if score > best:
+                best, best_square = score, square
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        self.history[square] = self.history.get(square, 0) + depth * depth
+                        break
+
+        bound = UPPER_BOUND if best <= alpha_start else LOWER_BOUND if best >= beta else EXACT
+        self.table[key] = (depth, best, bound, best_square)
+        return best
+
+    def search(self):
+        """Best square found within the time budget, from the deepest completed iteration."""
+        self.deadline = time.perf_counter() + self.time_budget
+        moves = self.ordered_moves()
+        best_square = moves[0]
+        if len(moves) == 1:
+            return best_square
+        for depth in range(1, self.max_depth + 1):
+            try:
+                score = self.negamax(depth, -WIN_SCORE - 1, WIN_SCORE + 1, 0)
+            except _SearchTimeout:
+                break
+            best_square = self.table[(self.board.stones[self.board.to_move],
+                                      self.board.stones[self.board.to_move ^ 1])][3]
+            self.depth_reached = depth
+            if abs(score) > WIN_SCORE - self.board.size:
+                break   # forced win or loss found: searching deeper cannot change it
+        return best_square
+
 # --- 4. PLAYER & COMPUTER MOVES ---
 
 def take_human_turn(current_board, marker):
-    """Handles human input validation and updates the board."""
+    """Handles human input validation, updates the board and returns the (row, col) played."""
+    height, width = len(current_board), len(current_board[0])
+    n_squares = width * height
     while True:
         try:
-            player_choice = int(input(f"Player {marker} (Human), choose a square (1-9): "))
+            player_choice = int(input(f"Player {marker} (Human), choose a square (1-{n_squares}): "))
         except ValueError:
-            print("❌ Invalid input. Please enter a whole number between 1 and 9.")
+            print(f"❌ Invalid input. Please enter a whole number between 1 and {n_squares}.")
             continue
             
-        if not 1 <= player_choice <= 9:
-            print("❌ Number out of range. Please choose a number between 1 and 9.")
+        if not 1 <= player_choice <= n_squares:
+            print(f"❌ Number out of range. Please choose a number between 1 and {n_squares}.")
             continue
             
-        r, c = number_to_coords(player_choice)
+        r, c = number_to_coords(player_choice, width, height)
         
         # Check if square is unoccupied
         if current_board[r][c] != '.':
@@ -92,75 +499,209 @@ def take_human_turn(current_board, marker):
             continue
             
         current_board[r][c] = marker
-        return True
+        return r, c
         
-def take_computer_turn(current_board, marker):
-    """Computer moves: selects a random, unoccupied square."""
-    print(f"Player {marker} (Computer) is thinking...")
-    
-    # Find all available square coordinates (row, col)
-    available_moves = []
-    for r in range(3):
-        for c in range(3):
-            if current_board[r][c] == '.':
-                available_moves.append((r, c))
-    
-    if available_moves:
-        # Select one available move randomly
-        r, c = available_moves[randint(0, len(available_moves) - 1)]
-        current_board[r][c] = marker
-        return True
-    
-    return False
+def take_computer_turn(current_board, marker, k=3, time_budget=1.0):
+    """
+    Computer moves and returns the (row, col) played (False if the board is full). The
+    classic 3x3 game uses the perfect-play table; other boards use the iterative-deepening
+    search within time_budget seconds.
+    """
+    height, width = len(current_board), len(current_board[0])
+    if (width, height, k) == (3, 3, 3):
+        mine, theirs = board_to_bits(current_board, marker)
+        if not FULL_BOARD & ~(mine | theirs):
+            return False
+        square = best_move(mine, theirs)
+    else:
+        board = MNKBoard.from_lists(current_board, marker, k)
+        if not board.empty():
+            return False
+        square = MNKSearch(board, time_budget).search()
 
-# --- 5. MAIN GAME LOOP ---
+    r, c = divmod(square, width)
+    current_board[r][c] = marker
+    return r, c
 
-turn_count = 0 
-winner = None
+# --- 5. HEADLESS SELF-PLAY (Strategy Tournament) ---
 
-# Game continues until board is full OR a winner is found
-while turn_count < MAX_SQUARES and winner is None:
-    
-    # Clear screen and display board (REQUIRED)
-    try:
-        clear_output(wait=True)
-    except NameError:
-        os.system('cls' if os.name == 'nt' else 'clear') 
+# Lookup tables for the hot path: WINNING[bits] replaces the mask loop, and
+# EMPTY_SQUARES[empty] lists the free squares of an empty-square bitmask
+WINNING = tuple(is_win(bits) for bits in range(512))
+EMPTY_SQUARES = tuple(tuple(i for i in range(9) if empty >> i & 1) for empty in range(512))
 
-    print("### Tic-Tac-Toe Board ###")
-    print_board(board)
-    print("-------------------------")
+# Every strategy is called as strategy(mine, theirs, rng) and returns a free square 0-8
 
-    # Human ('X') moves first (turn_count 0, 2, 4...)
-    is_human_turn = turn_count % 2 == 0
-    player_marker = 'X' if is_human_turn else 'O'
-    
-    # Take the turn
-    if is_human_turn:
-        take_human_turn(board, player_marker)
+def random_strategy(mine, theirs, rng):
+    """Any free square, uniformly at random."""
+    return rng.choice(EMPTY_SQUARES[FULL_BOARD & ~(mine | theirs)])
+
+def greedy_strategy(mine, theirs, rng):
+    """Wins immediately if it can, otherwise blocks an immediate loss, otherwise plays randomly."""
+    squares = EMPTY_SQUARES[FULL_BOARD & ~(mine | theirs)]
+    for square in squares:
+        if WINNING[mine | 1 << square]:
+            return square
+    for square in squares:
+        if WINNING[theirs | 1 << square]:
+            return square
+    return rng.choice(squares)
+
+# best_move() per exact position, skipping the symmetry reduction on repeat visits
+_PERFECT_MOVES = {}
+
+def minimax_strategy(mine, theirs, rng):
+    """Perfect play from the alpha-beta engine (deterministic)."""
+    key = mine | theirs << 9
+    move = _PERFECT_MOVES.get(key)
+    if move is None:
+        move = _PERFECT_MOVES[key] = best_move(mine, theirs)
+    return move
+
+STRATEGIES = {
+    'random': random_strategy,
+    'greedy': greedy_strategy,
+    'minimax': minimax_strategy,
+}
+
+def play_game(first, second, rng):
+    """Plays one silent game; returns 1 or 2 for the winning player (1 moves first), 0 for a draw."""
+    mine, theirs = 0, 0
+    players = (first, second)
+    for turn in range(MAX_SQUARES):
+        mine |= 1 << players[turn & 1](mine, theirs, rng)
+        if WINNING[mine]:
+            return 1 + (turn & 1)
+        mine, theirs = theirs, mine
+    return 0
+
+def play_batch(first_name, second_name, n_games, seed):
+    """
+    Plays n_games between two named strategies with their own random.Random(seed) and
+    returns the counts [draws, first player wins, second player wins].
+    """
+    first, second = STRATEGIES[first_name], STRATEGIES[second_name]
+    if 'minimax' in (first_name, second_name):
+        warm_up()
+    rng = random.Random(seed)
+    counts = [0, 0, 0]
+    for _ in range(n_games):
+        counts[play_game(first, second, rng)] += 1
+    return counts
+
+def play_match(first_name, second_name, n_games, seed=0, workers=None, batch_size=100000):
+    """
+    Plays n_games split into batches across a process pool. Batch i is seeded with
+    '<seed>-<i>', so the results depend only on the seed and batch size, not on the
+    number of workers. Returns the counts [draws, first player wins, second player wins].
+    """
+    n_batches = -(-n_games // batch_size)
+    args = [(first_name, second_name, min(batch_size, n_games - i * batch_size), f'{seed}-{i}')
+            for i in range(n_batches)]
+    if workers == 1 or n_batches == 1:
+        results = [play_batch(*batch_args) for batch_args in args]
     else:
-        time.sleep(0.5) # Simulate computer thinking
-        take_computer_turn(board, player_marker)
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(play_batch, *zip(*args)))
+    return [sum(column) for column in zip(*results)]
+
+def run_tournament(names, n_games, seed=0, workers=None):
+    """Plays every ordered pairing of the named strategies and prints win/draw/loss rates."""
+    print(f"{'First (X)':<10}{'Second (O)':<12}{'X wins':>9}{'Draws':>9}{'O wins':>9}{'Games/s':>12}")
+    for first_name in names:
+        for second_name in names:
+            start = time.perf_counter()
+            draws, first_wins, second_wins = play_match(first_name, second_name, n_games, seed, workers)
+            elapsed = time.perf_counter() - start
+            print(f"{first_name:<10}{second_name:<12}{first_wins / n_games:>9.2%}{draws / n_games:>9.2%}"
+                  f"{second_wins / n_games:>9.2%}{n_games / elapsed:>12,.0f}")
+
+# --- 6. INTERACTIVE GAME (Human vs Computer) ---
+
+def play_interactive(width=3, height=3, k=3, time_budget=1.0):
+    """
+    Plays one game at the terminal: the human is X and moves first. Any width x height
+    board with k in a row to win; the computer thinks for up to time_budget seconds.
+    """
+    board = new_board(width, height)
+    max_squares = width * height
+
+    if (width, height, k) == (3, 3, 3):
+        # Solve the game once (well under a second); every computer move is then a table lookup
+        warm_up()
+
+    turn_count = 0 
+    winner = None
+
+    # Game continues until board is full OR a winner is found
+    while turn_count < max_squares and winner is None:
         
-    # Check for a winner after each move (REQUIRED)
-    if check_win(board, player_marker):
-        winner = player_marker
+        # Clear screen and display board (REQUIRED)
+        clear_screen()
+
+        print("### Tic-Tac-Toe Board ###")
+        print_board(board)
+        print("-------------------------")
+
+        # Human ('X') moves first (turn_count 0, 2, 4...)
+        is_human_turn = turn_count % 2 == 0
+        player_marker = 'X' if is_human_turn else 'O'
         
-    turn_count += 1
-    
-# --- 6. GAME END ---
-
-# Final display
-try:
-    clear_output(wait=True)
-except NameError:
-    os.system('cls' if os.name == 'nt' else 'clear') 
-
-print("### FINAL BOARD ###")
-print_board(board)
-print("-------------------")
-
-if winner:
-    print(f"🎉 GAME OVER! Player {winner} WINS! 🎉")
-elif turn_count == MAX_SQUARES:
-    print("🤝 GAME OVER! It's a DRAW (Board is full). 🤝")
+        # Take the turn
+        if is_human_turn:
+            last_move = take_human_turn(board, player_marker)
+        else:
+            last_move = take_computer_turn(board, player_marker, k, time_budget)
+            
+        # Check for a winner after each move (REQUIRED): only the lines through the new mark
+        if check_win(board, player_marker, last_move, k):
+            winner = player_marker
+            
+        turn_count += 1
+        
+    # --- GAME END ---
+
+    # Final display
+    clear_screen()
+
+    print("### FINAL BOARD ###")
+    print_board(board)
+    print("-------------------")
+
+    if winner:
+        print(f"🎉 GAME OVER! Player {winner} WINS! 🎉")
+    elif turn_count == max_squares:
+        print("🤝 GAME OVER! It's a DRAW (Board is full). 🤝")
+
+# --- 7. COMMAND-LINE ENTRY POINT ---
+
+def main(argv=None):
+    """Plays an interactive game, or a headless strategy tournament with --headless."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe against a perfect-play engine, or headless self-play.")
+    parser.add_argument('--width', type=int, default=3, help="board width for the interactive game")
+    parser.add_argument('--height', type=int, default=3, help="board height for the interactive game")
+    parser.add_argument('--k', type=int, default=3, help="marks in a row needed to win (e.g. 5 on a 15x15 board)")
+    parser.add_argument('--think', type=float, default=1.0, help="computer's time budget per move (seconds)")
+    parser.add_argument('--headless', action='store_true', help="play a silent tournament between strategies")
+    parser.add_argument('--strategies', default=','.join(STRATEGIES),
+                        help=f"comma-separated strategies to pit against each other ({', '.join(STRATEGIES)})")
+    parser.add_argument('--games', type=int, default=1000000, help="games per pairing")
+    parser.add_argument('--workers', type=int, help="worker processes (default: all cores)")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the random strategies")
+    args = parser.parse_args(argv)
+
+    if not args.headless:
+        play_interactive(args.width, args.height, args.k, args.think)
+        return
+
+    names = args.strategies.split(',')
+    unknown = [name for name in names if name not in STRATEGIES]
+    if unknown:
+        parser.error(f"unknown strategies: {', '.join(unknown)}")
+    run_tournament(names, args.games, args.seed, args.workers)
+
+if __name__ == "__main__":
+    main()
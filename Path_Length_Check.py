@@ -0,0 +1,116 @@
+# =====================================================================
+# FILE: Path_Length_Check.py
+# AIM: Checks the paths found by the LAB_06 PathFinder on a large random-wall map
+# against an exact breadth-first search of the whole grid, for short trips across a
+# chunk border and for long trips across the map.
+# =====================================================================
+
+import argparse
+import random
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from LAB_06_Classes import WALL, PathFinder, TileMap, random_wall_loader
+
+def grid_graph(tiles, width, height):
+    """Sparse 4-connected graph of the map's walkable squares (node y * width + x)."""
+    from scipy.sparse import coo_matrix
+
+    size = tiles.chunk_size
+    walk = np.ones((height, width), dtype=bool)
+    for cy in range(-(-height // size)):
+        for cx in range(-(-width // size)):
+            chunk = tiles.chunk((cx, cy))
+            if chunk is not None:
+                h, w = min(size, height - cy * size), min(size, width - cx * size)
+                walk[cy * size:cy * size + h, cx * size:cx * size + w] = chunk[:h, :w] != WALL
+    index = np.arange(width * height).reshape(height, width)
+    right = walk[:, :-1] & walk[:, 1:]
+    down = walk[:-1, :] & walk[1:, :]
+    rows = np.concatenate([index[:, :-1][right], index[:-1, :][down]])
+    cols = np.concatenate([index[:, 1:][right], index[1:, :][down]])
+    return coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(walk.size, walk.size)).tocsr()
+
+def bfs_steps(graph, width, start, goal):
+    """Exact number of steps from start to goal (inf if unreachable)."""
+    from scipy.sparse.csgraph import shortest_path
+    dist = shortest_path(graph, directed=False, unweighted=True, indices=start[1] * width + start[0])
+    return dist[goal[1] * width + goal[0]]
+
+def random_queries(tiles, width, height, n, rng, max_offset=None):
+    """
+    n (start, goal) pairs of floor squares. With max_offset the goal is at most that
+    many squares from the start in x and y and always in a different chunk.
+    """
+    queries = []
+    while len(queries) < n:
+        start = (rng.randrange(width), rng.randrange(height))
+        if max_offset is None:
+            goal = (rng.randrange(width), rng.randrange(height))
+        else:
+            goal = (min(width - 1, max(0, start[0] + rng.randint(-max_offset, max_offset))),
+                    min(height - 1, max(0, start[1] + rng.randint(-max_offset, max_offset))))
+            if tiles.chunk_key(*start) == tiles.chunk_key(*goal):
+                continue
+        if not tiles.is_wall(*start) and not tiles.is_wall(*goal):
+            queries.append((start, goal))
+    return queries
+
+def check(pathfinder, graph, queries):
+    """Per query: (steps found, BFS steps, seconds). Raises AssertionError on an invalid path."""
+    results = []
+    for start, goal in queries:
+        t0 = time.perf_counter()
+        path = pathfinder.find_path(start, goal)
+        seconds = time.perf_counter() - t0
+        exact = bfs_steps(graph, pathfinder.width, start, goal)
+        if path is None:
+            assert exact == np.inf, f"{start}->{goal}: no path found but BFS has {exact:.0f} steps"
+            continue
+        assert path[0] == start and path[-1] == goal, f"{start}->{goal}: path has the wrong ends"
+        assert all(abs(x1 - x2) + abs(y1 - y2) == 1 for (x1, y1), (x2, y2) in zip(path, path[1:])), \
+            f"{start}->{goal}: path is not 4-connected"
+        assert not any(pathfinder.tiles.is_wall(x, y) for x, y in path), f"{start}->{goal}: path crosses a wall"
+        results.append((len(path) - 1, exact, seconds))
+    return results
+
+def report(label, results):
+    """Prints the length ratios and timings; returns the worst length ratio."""
+    ratios = [found / exact if exact else 1.0 for found, exact, _ in results]
+    times = sorted(seconds for _, _, seconds in results)
+    worst = max(ratios, default=1.0)
+    print(f"{label:<14}{len(results):>8}{statistics.fmean(ratios):>12.4f}{worst:>12.4f}"
+          f"{1e3 * statistics.median(times):>12.2f}{1e3 * times[-1]:>12.2f}")
+    return worst
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare PathFinder path lengths with an exact BFS.")
+    parser.add_argument('--size', type=int, default=1000, help="map width and height in squares")
+    parser.add_argument('--walls', type=float, default=0.25, help="fraction of squares that are walls")
+    parser.add_argument('--short', type=int, default=120, help="short queries across a chunk border")
+    parser.add_argument('--long', type=int, default=20, help="queries between random squares")
+    parser.add_argument('--max-offset', type=int, default=16, help="largest x/y distance of a short query")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    tiles = TileMap(64, random_wall_loader(args.walls, args.seed))
+    pathfinder = PathFinder(tiles, args.size, args.size)
+    graph = grid_graph(tiles, args.size, args.size)
+    rng = random.Random(args.seed)
+    short = random_queries(tiles, args.size, args.size, args.short, rng, args.max_offset)
+    long = random_queries(tiles, args.size, args.size, args.long, rng)
+
+    print(f"{'Queries':<14}{'paths':>8}{'mean ratio':>12}{'worst ratio':>12}{'median ms':>12}{'max ms':>12}")
+    worst_short = report('short', check(pathfinder, graph, short))
+    report('long', check(pathfinder, graph, long))
+
+    # Short trips are searched square by square, so they must match BFS exactly
+    if worst_short > 1.0:
+        print("FAIL: a short query is longer than the BFS shortest path")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
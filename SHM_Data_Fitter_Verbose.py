@@ -10,129 +10,401 @@
 
 # 1. IMPORT NECESSARY LIBRARIES FOR COMPUTATION AND VISUALIZATION
 
+# Only numpy is imported up front. scipy, matplotlib and the process pool are imported
+# inside the functions that need them, so importing this module as a library is quick
+# and has no side effects; the demonstration runs from main().
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit
 import math
+import time
 
 # ---------------------------------------------------------------------
 # --- SECTION 2: DATA GENERATION (Simulating a physical experiment) ---
 # ---------------------------------------------------------------------
 
 # Define the true physical parameters for generating clean, ideal data.
-T_true = 1.25   # True physical period in seconds
+T_true = 1.25   # True physical period in seconds
 omega_true = 2 * math.pi / T_true # Calculate angular frequency (omega = 2*pi / T)
 
-# Create a time array (the independent variable 't')
-t_data = np.linspace(0, 5, 50) # 50 data points collected over 5 seconds
+def generate_data(n_points=50, duration=5.0, noise=0.5, rng=None):
+    """
+    Simulates the experiment: returns (t_data, y_true, y_data), where y_data is the
+    ideal SHM curve plus Gaussian measurement noise of standard deviation `noise`.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
 
-# Generate the ideal, clean Simple Harmonic Motion (SHM) curve.
-# SHM Formula: y = A * cos(omega*t + phi) + C
-y_true = 5.0 * np.cos(omega_true * t_data + 0.5) + 10.0
+    # Create a time array (the independent variable 't')
+    t_data = np.linspace(0, duration, n_points) # 50 data points collected over 5 seconds
 
-# Add random noise to the ideal data to simulate real-world experimental measurement errors.
-y_data = y_true + 0.5 * np.random.normal(size=len(t_data)) 
+    # Generate the ideal, clean Simple Harmonic Motion (SHM) curve.
+    # SHM Formula: y = A * cos(omega*t + phi) + C
+    y_true = 5.0 * np.cos(omega_true * t_data + 0.5) + 10.0
+
+    # Add random noise to the ideal data to simulate real-world experimental measurement errors.
+    y_data = y_true + noise * rng.normal(size=len(t_data))
+    return t_data, y_true, y_data
 
 # ---------------------------------------------------------------------
 # --- SECTION 3: MATHEMATICAL MODEL DEFINITION ---
 # ---------------------------------------------------------------------
 
 def shm_model(t, A, omega, phi, C):
-    """
-    Defines the general sinusoidal mathematical model used for the non-linear regression.
-    This function represents the expected physical behavior of the system.
-    
-    INPUTS:
-    - t (Time): The independent variable array.
-    - A (Amplitude): Maximum displacement from equilibrium.
-    - omega (Angular Frequency): Rate of oscillation.
-    - phi (Phase Angle): Horizontal shift of the wave.
-    - C (Vertical Offset): The equilibrium point (mean).
-    """
-    return A * np.cos(omega * t + phi) + C
+    """
+    Defines the general sinusoidal mathematical model used for the non-linear regression.
+    This function represents the expected physical behavior of the system.
+    
+    INPUTS:
+    - t (Time): The independent variable array.
+    - A (Amplitude): Maximum displacement from equilibrium.
+    - omega (Angular Frequency): Rate of oscillation.
+    - phi (Phase Angle): Horizontal shift of the wave.
+    - C (Vertical Offset): The equilibrium point (mean).
+    """
+    return A * np.cos(omega * t + phi) + C
+
+def shm_jacobian(t, A, omega, phi, C):
+    """
+    Analytic partial derivatives of shm_model with respect to (A, omega, phi, C).
+    Passed to curve_fit as `jac`, so the solver does not spend extra model evaluations
+    on finite-difference derivatives. Returns an array of shape (len(t), 4).
+    """
+    arg = omega * t + phi
+    cos_arg = np.cos(arg)
+    A_sin_arg = A * np.sin(arg)
+    return np.column_stack((cos_arg, -t * A_sin_arg, -A_sin_arg, np.ones_like(t)))
 
 # ---------------------------------------------------------------------
 # --- SECTION 4: INITIAL PARAMETER GUESSES (CRITICAL FOR OPTIMIZATION) ---
 # ---------------------------------------------------------------------
 
 # The non-linear solver requires good initial guesses (p0) to find the optimum fit (popt).
-# We estimate these parameters directly from the raw, noisy data to aid convergence.
-
-# A. Vertical Offset (C): Estimated as the mean of all collected data points.
-C_guess = np.mean(y_data)
+# We estimate these parameters directly from the raw, noisy data to aid convergence,
+# without assuming the period is known in advance.
 
-# B. Amplitude (A): Estimated as half of the observed peak-to-peak range.
-A_guess = (np.max(y_data) - np.min(y_data)) / 2
+def estimate_omega(t, y, oversample=8):
+    """
+    Estimates the angular frequency from the peak of the periodogram.
+    Uniformly sampled data uses a zero-padded FFT, irregular sampling a Lomb-Scargle
+    periodogram; in both cases the peak is refined by parabolic interpolation.
+    """
+    t = np.asarray(t, dtype=float)
+    y = np.asarray(y, dtype=float) - np.mean(y)
+    dt = np.diff(t)
 
-# C. Angular Frequency (omega): Estimate based on the true known period (1.25s) from the simulation setup.
-T_guess = 1.25 
-omega_guess = 2 * math.pi / T_guess
+    if np.allclose(dt, dt[0], rtol=1e-6):
+        # Uniform sampling: zero padding interpolates the spectrum between FFT bins
+        n_fft = oversample * len(y)
+        power = np.abs(np.fft.rfft(y, n_fft))**2
+        omegas = 2 * math.pi * np.fft.rfftfreq(n_fft, dt[0])
+    else:
+        from scipy.signal import lombscargle
+        # From one cycle over the record up to the (pseudo-)Nyquist frequency
+        span = t[-1] - t[0]
+        omegas = np.linspace(2 * math.pi / span, math.pi / np.median(dt), oversample * len(y))
+        power = lombscargle(t, y, omegas)
 
-# D. Phase Angle (phi): Usually initialized to zero radians for stability.
-phi_guess = 0.0
+    # Skip the zero-frequency bin, then fit a parabola through the peak and its neighbours
+    k = int(np.argmax(power[1:])) + 1
+    if k + 1 < len(power):
+        p_left, p_peak, p_right = power[k - 1], power[k], power[k + 1]
+        curvature = p_left - 2 * p_peak + p_right
+        if curvature < 0:
+            shift = 0.5 * (p_left - p_right) / curvature
+            return omegas[k] + shift * (omegas[k + 1] - omegas[k])
+    return omegas[k]
 
-# Store the initial guesses in the required vector format.
-p0 = [A_guess, omega_guess, phi_guess, C_guess] 
+def estimate_initial_guess(t, y):
+    """
+    Initial guesses [A, omega, phi, C] for shm_model.
 
-print("--- Initializing Solver ---")
-print(f"Initial Parameter Guesses (p0): {p0}")
-print("-" * 30)
+    With omega fixed at the periodogram peak, y = a*cos(omega*t) + b*sin(omega*t) + C is
+    linear in (a, b, C) and is solved exactly by linear least squares. Then
+    A*cos(omega*t + phi) = A*cos(phi)*cos(omega*t) - A*sin(phi)*sin(omega*t) gives
+    A = hypot(a, b) and phi = atan2(-b, a).
+    """
+    t = np.asarray(t, dtype=float)
+    omega = estimate_omega(t, y)
+    design = np.column_stack((np.cos(omega * t), np.sin(omega * t), np.ones_like(t)))
+    (a, b, C), *_ = np.linalg.lstsq(design, y, rcond=None)
+    return [math.hypot(a, b), float(omega), math.atan2(-b, a), float(C)]
 
 # ---------------------------------------------------------------------
 # --- SECTION 5: NON-LINEAR CURVE FITTING (Least Squares Optimization) ---
 # ---------------------------------------------------------------------
 
-# The try/except block handles potential RuntimeError if the optimization fails to converge.
-try:
-    # curve_fit performs the Levenberg-Marquardt algorithm (non-linear least squares).
-    popt, pcov = curve_fit(shm_model, t_data, y_data, p0=p0)
-    
-    # Extract the final optimized parameters (popt)
-    A_fit, omega_fit, phi_fit, C_fit = popt
-    
-    # Calculate derived quantity: The fitted physical period.
-    T_fit = 2 * math.pi / omega_fit
-
-except RuntimeError:
-    print("\nError: Optimization failed. Check data or adjust initial guesses.")
-    # Use initial guess values if the optimization process fails.
-    A_fit, omega_fit, phi_fit, C_fit = p0
-    T_fit = 2 * math.pi / omega_guess 
+def fit_shm(t, y, p0=None):
+    """
+    Fits shm_model to (t, y) and returns (popt, pcov). p0 defaults to
+    estimate_initial_guess(t, y). Raises RuntimeError if the optimization fails to converge.
+    """
+    from scipy.optimize import curve_fit
+
+    if p0 is None:
+        p0 = estimate_initial_guess(t, y)
+    # curve_fit performs the Levenberg-Marquardt algorithm (non-linear least squares).
+    return curve_fit(shm_model, t, y, p0=p0, jac=shm_jacobian)
+
+# ---------------------------------------------------------------------
+# --- SECTION 5B: BATCH FITTING OVER MANY CHANNELS ---
+# ---------------------------------------------------------------------
+
+# One record per channel: fitted (A, omega, phi, C), their standard errors,
+# whether the solver converged, and how many model evaluations it used.
+FIT_RESULT_DTYPE = np.dtype([
+    ("popt", np.float64, 4),
+    ("perr", np.float64, 4),
+    ("converged", np.bool_),
+    ("nfev", np.int64),
+])
+
+def fit_channel(t, y, p0=None):
+    """
+    Fits shm_model to one series with the analytic Jacobian, from estimate_initial_guess
+    if p0 is None. Returns a FIT_RESULT_DTYPE record. A fit that fails (no convergence,
+    or NaN/inf samples in the series) is recorded with converged=False, NaN errors and
+    p0 (NaN if it could not be estimated) instead of raising.
+    """
+    from scipy.optimize import curve_fit
+
+    result = np.zeros((), dtype=FIT_RESULT_DTYPE)
+    result["popt"] = np.nan if p0 is None else p0
+    result["perr"] = np.nan
+    if not (np.isfinite(y).all() and np.isfinite(t).all()):
+        return result   # a dropped-out sensor: nothing to fit
+    try:
+        if p0 is None:
+            p0 = estimate_initial_guess(t, y)
+            result["popt"] = p0
+        popt, pcov, info, _, ier = curve_fit(shm_model, t, y, p0=p0, jac=shm_jacobian, full_output=True)
+    except (RuntimeError, ValueError):
+        # ValueError (LinAlgError included) comes from a degenerate series
+        return result
+    result["popt"] = popt
+    result["perr"] = np.sqrt(np.diag(pcov))
+    result["converged"] = ier in (1, 2, 3, 4)
+    result["nfev"] = info["nfev"]
+    return result
+
+def _fit_block(t, Y_block, p0_block):
+    """Process-pool worker: fits a block of channels (p0_block None: estimate each guess here)."""
+    if p0_block is None:
+        p0_block = [None] * len(Y_block)
+    return np.array([fit_channel(t, y, p0) for y, p0 in zip(Y_block, p0_block)], dtype=FIT_RESULT_DTYPE)
+
+def fit_channels(t, Y, p0=None, workers=None, block_size=64):
+    """
+    Fits every row of the 2-D array Y (channels x samples, all sampled at times t).
+
+    p0 may be None (estimated per channel, inside the workers), one shared guess of 4
+    values, or one guess per channel. Channels are fitted in blocks of block_size
+    across a process pool (workers=1 fits them in this process). Returns a
+    FIT_RESULT_DTYPE array; channels whose fit failed have converged=False.
+    """
+    t = np.asarray(t, dtype=float)
+    Y = np.atleast_2d(np.asarray(Y, dtype=float))
+    if p0 is not None:
+        p0 = np.broadcast_to(np.asarray(p0, dtype=float), (len(Y), 4))
+
+    blocks = [(Y[i:i + block_size], None if p0 is None else p0[i:i + block_size])
+              for i in range(0, len(Y), block_size)]
+    if workers == 1 or len(blocks) == 1:
+        parts = [_fit_block(t, Y_block, p0_block) for Y_block, p0_block in blocks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_fit_block, [t] * len(blocks), *zip(*blocks)))
+
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=FIT_RESULT_DTYPE)
+
+# ---------------------------------------------------------------------
+# --- SECTION 5C: STREAMING SLIDING-WINDOW TRACKER ---
+# ---------------------------------------------------------------------
+
+class SHMTracker:
+    """
+    Follows a slowly drifting oscillator on a live sample stream.
+
+    The most recent `window` samples are kept in a fixed-size ring buffer. Every
+    `refit_every` samples the window is refitted, warm-started from the previous popt
+    and capped at `max_nfev` model evaluations, so each sample has bounded cost and
+    memory. The first fit (and any refit after a failure) is seeded from
+    estimate_initial_guess. Estimates use the same (A, omega, phi, C) convention as
+    shm_model, with phi referred to t = 0.
+    """
+
+    def __init__(self, window=50, refit_every=1, max_nfev=20):
+        self.window = window
+        self.refit_every = refit_every
+        self.max_nfev = max_nfev
+        self._t = np.empty(window)
+        self._y = np.empty(window)
+        self._head = 0          # next slot to overwrite
+        self._count = 0         # samples seen so far
+        self.popt = None        # current [A, omega, phi, C], None until the first fit
+        self.n_refits = 0
+        self.n_failures = 0
+        self.nfev = 0
+
+    def _window(self):
+        """Buffered samples in time order (copies at most `window` values)."""
+        if self._count < self.window:
+            return self._t[:self._count], self._y[:self._count]
+        order = np.r_[self._head:self.window, 0:self._head]
+        return self._t[order], self._y[order]
+
+    def _refit(self):
+        from scipy.optimize import curve_fit
+
+        t, y = self._window()
+        # Fit in window-local time: with t near 0 the omega and phi columns of the
+        # Jacobian stay well conditioned however long the stream has been running.
+        t_ref = t[-1]
+        t_local = t - t_ref
+        if self.popt is None:
+            p0 = estimate_initial_guess(t_local, y)
+        else:
+            A, omega, phi, C = self.popt
+            p0 = [A, omega, phi + omega * t_ref, C]
+        try:
+            popt, _, info, _, _ = curve_fit(shm_model, t_local, y, p0=p0, jac=shm_jacobian,
+                                           maxfev=self.max_nfev, full_output=True)
+        except RuntimeError:
+            # Lost lock (or ran out of evaluations): re-seed from the periodogram next time
+            self.n_failures += 1
+            self.nfev += self.max_nfev
+            self.popt = None
+            return
+        A, omega, phi, C = popt
+        if A < 0:
+            A, phi = -A, phi + math.pi
+        phi = math.remainder(phi - omega * t_ref, 2 * math.pi)
+        self.popt = np.array([A, omega, phi, C])
+        self.n_refits += 1
+        self.nfev += info["nfev"]
+
+    def update(self, t, y):
+        """Adds one sample and returns the current estimate (None while warming up)."""
+        self._t[self._head] = t
+        self._y[self._head] = y
+        self._head = (self._head + 1) % self.window
+        self._count += 1
+        if self._count >= self.window and (self._count - self.window) % self.refit_every == 0:
+            self._refit()
+        return self.popt
+
+    def extend(self, t, y):
+        """Feeds a block of samples; returns an (n, 4) array of estimates, NaN while warming up."""
+        estimates = np.full((len(t), 4), np.nan)
+        for i, (t_i, y_i) in enumerate(zip(t, y)):
+            popt = self.update(t_i, y_i)
+            if popt is not None:
+                estimates[i] = popt
+        return estimates
 
 # ---------------------------------------------------------------------
 # --- SECTION 6: RESULTS OUTPUT AND VISUALIZATION ---
 # ---------------------------------------------------------------------
 
+def plot_fit(t_data, y_data, popt):
+    """Plots the raw data, the best-fit curve and the fitted equilibrium position."""
+    import matplotlib.pyplot as plt
+
+    A_fit, omega_fit, phi_fit, C_fit = popt
+    T_fit = 2 * math.pi / omega_fit
+
+    # Prepare the final smooth curve for plotting.
+    t_fit = np.linspace(min(t_data), max(t_data), 500)
+    y_fit = shm_model(t_fit, *popt) 
+
+    plt.figure(figsize=(10, 6))
+    
+    # Plot 1: Display the original raw data points (the experiment).
+    plt.scatter(t_data, y_data, label='Experimental Data (with Noise)', s=20, color='darkgray', alpha=0.8)
+    
+    # Plot 2: Display the smooth best-fit curve (the theory validated by code).
+    plt.plot(t_fit, y_fit, color='red', linewidth=3, label=f'Best Fit Curve (T={T_fit:.2f}s)')
+    
+    # Add horizontal line showing the calculated equilibrium position (C).
+    plt.axhline(C_fit, color='blue', linestyle='--', label=f'Equilibrium Position (C={C_fit:.2f})')
+    
+    # Final plot formatting for professional presentation.
+    plt.title('Laboratory 8-1: Simple Harmonic Motion Data Fitting')
+    plt.xlabel('Time (s)')
+    plt.ylabel('Displacement (y)')
+    plt.legend()
+    plt.grid(True)
+    plt.show()
+
+def main():
+    """Runs the full demonstration: single fit, batch fit, streaming tracker and plot."""
+    rng = np.random.default_rng()
+    t_data, y_true, y_data = generate_data(rng=rng)
+
+    # Store the initial guesses in the required vector format: p0 = [A, omega, phi, C]
+    p0 = estimate_initial_guess(t_data, y_data)
+
+    print("--- Initializing Solver ---")
+    print(f"Initial Parameter Guesses (p0): {p0}")
+    print("-" * 30)
+
+    # The try/except block handles potential RuntimeError if the optimization fails to converge.
+    try:
+        popt, pcov = fit_shm(t_data, y_data, p0)
+    except RuntimeError:
+        print("\nError: Optimization failed. Check data or adjust initial guesses.")
+        # Use initial guess values if the optimization process fails.
+        popt = np.asarray(p0)
+
+    # Extract the final optimized parameters (popt)
+    A_fit, omega_fit, phi_fit, C_fit = popt
+    
+    # Calculate derived quantity: The fitted physical period.
+    T_fit = 2 * math.pi / omega_fit
+
+    # Print the final, numerically verified parameters in a clear, readable format.
+    print("\n--- FINAL FITTED SHM PARAMETERS (Verification) ---")
+    print(f"Amplitude (A): {A_fit:.4f}")
+    print(f"Angular Frequency (omega): {omega_fit:.4f} rad/s")
+    print(f"Period (T) [Derived]: {T_fit:.4f} seconds")
+    print(f"Phase Angle (phi): {phi_fit:.4f} radians")
+    print(f"Vertical Offset (C) [Equilibrium]: {C_fit:.4f}")
+    print("-" * 50)
+
+    # Batch demonstration: the same experiment recorded on 1000 noisy sensor channels.
+    n_channels = 1000
+    Y_channels = y_true + 0.5 * rng.normal(size=(n_channels, len(t_data)))
+    start = time.perf_counter()
+    batch = fit_channels(t_data, Y_channels)
+    elapsed = time.perf_counter() - start
+    print(f"\n--- BATCH FIT: {n_channels} CHANNELS ---")
+    print(f"Converged: {np.count_nonzero(batch['converged'])}/{n_channels} in {elapsed:.2f} s")
+    print(f"Mean Period (T): {np.mean(2 * math.pi / batch['popt'][:, 1]):.4f} seconds")
+    print(f"Mean Solver Evaluations per Channel: {np.mean(batch['nfev']):.1f}")
+    print("-" * 50)
+
+    # Streaming demonstration: a 200 s feed whose period drifts from 1.25 s to 1.0 s.
+    dt_stream = t_data[1] - t_data[0]
+    t_stream = np.arange(0, 200, dt_stream)
+    omega_start, omega_end = 2 * math.pi / 1.25, 2 * math.pi / 1.0
+    chirp = (omega_end - omega_start) / t_stream[-1]
+    y_stream = 5.0 * np.cos(omega_start * t_stream + 0.5 * chirp * t_stream**2 + 0.5) + 10.0
+    y_stream += 0.5 * rng.normal(size=len(t_stream))
+    tracker = SHMTracker(window=len(t_data))
+    start = time.perf_counter()
+    estimates = tracker.extend(t_stream, y_stream)
+    elapsed = time.perf_counter() - start
+    # Compare against the true instantaneous omega at the window centre
+    lag = 0.5 * (tracker.window - 1) * dt_stream
+    omega_centre = omega_start + chirp * (t_stream - lag)
+    tracked = ~np.isnan(estimates[:, 1])
+    print(f"\n--- STREAMING TRACKER: {len(t_stream)} SAMPLES ---")
+    print(f"Refits: {tracker.n_refits} ({tracker.n_failures} failed), "
+          f"{1e6 * elapsed / len(t_stream):.0f} us and {tracker.nfev / len(t_stream):.1f} evaluations per sample")
+    print(f"Final Period (T): {2 * math.pi / estimates[-1, 1]:.4f} seconds (true 1.0000)")
+    print(f"RMS omega error vs window centre: "
+          f"{np.sqrt(np.mean((estimates[tracked, 1] - omega_centre[tracked])**2)):.4f} rad/s")
+    print("-" * 50)
+
+    plot_fit(t_data, y_data, popt)
+
 if __name__ == "__main__":
-    
-    # Print the final, numerically verified parameters in a clear, readable format.
-    print("\n--- FINAL FITTED SHM PARAMETERS (Verification) ---")
-    print(f"Amplitude (A): {A_fit:.4f}")
-    print(f"Angular Frequency (omega): {omega_fit:.4f} rad/s")
-    print(f"Period (T) [Derived]: {T_fit:.4f} seconds")
-    print(f"Phase Angle (phi): {phi_fit:.4f} radians")
-    print(f"Vertical Offset (C) [Equilibrium]: {C_fit:.4f}")
-    print("-" * 50)
-
-    # Prepare the final smooth curve for plotting.
-    t_fit = np.linspace(min(t_data), max(t_data), 500)
-    y_fit = shm_model(t_fit, *popt) 
-
-    plt.figure(figsize=(10, 6))
-    
-    # Plot 1: Display the original raw data points (the experiment).
-    plt.scatter(t_data, y_data, label='Experimental Data (with Noise)', s=20, color='darkgray', alpha=0.8)
-    
-    # Plot 2: Display the smooth best-fit curve (the theory validated by code).
-    plt.plot(t_fit, y_fit, color='red', linewidth=3, label=f'Best Fit Curve (T={T_fit:.2f}s)')
-    
-    # Add horizontal line showing the calculated equilibrium position (C).
-    plt.axhline(C_fit, color='blue', linestyle='--', label=f'Equilibrium Position (C={C_fit:.2f})')
-    
-    # Final plot formatting for professional presentation.
-    plt.title('Laboratory 8-1: Simple Harmonic Motion Data Fitting')
-    plt.xlabel('Time (s)')
-    plt.ylabel('Displacement (y)')
-    plt.legend()
-    plt.grid(True)
-    plt.show()
+    main()
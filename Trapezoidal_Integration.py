@@ -1,7 +1,14 @@
 # =====================================================================
 # IMPORT ESSENTIAL LIBRARIES
 # =====================================================================
+import json
 import math
+import os
+import pickle
+import platform
+import time
+from collections import namedtuple
+import numpy as np
 
 # =====================================================================
 # A. CORE FUNCTION: TRAPEZOIDAL RULE LOGIC
@@ -22,7 +29,126 @@ def trapezoidal_rule(f, a, b, N):
     # Final calculation and return
     integral = integral_sum * (h / 2)
     return integral
-    
+
+def is_array_aware(f, a, b):
+    """Checks whether f accepts a NumPy array of nodes and returns one value per node."""
+    probe = np.linspace(a, b, 3)
+    try:
+        values = np.asarray(f(probe), dtype=float)
+    except (TypeError, ValueError):
+        return False
+    return values.shape == probe.shape
+
+def trapezoidal_rule_vectorized(f, a, b, N, chunk_size=2**20, array_aware=None):
+    """
+    Same result as trapezoidal_rule, but f is called once per chunk of up to chunk_size
+    nodes instead of once per node, so memory stays bounded for huge N.
+    Task functions are swapped for their array-capable variants; any other f that is
+    not array-aware falls back to the scalar loop. Pass array_aware if is_array_aware
+    has already been checked, to skip the probe call.
+    """
+    if a == b: return 0.0
+
+    f = ARRAY_VARIANTS.get(f, f)
+    if array_aware is None:
+        array_aware = is_array_aware(f, a, b)
+    if not array_aware:
+        return trapezoidal_rule(f, a, b, N)
+
+    h = (b - a) / N
+    # Endpoints as floats: integer bounds would give an int64 array (overflow, int powers)
+    integral_sum = float(np.sum(f(np.array([a, b], dtype=float))))
+
+    # Add twice the sum of the intermediate points, one chunk of nodes at a time
+    for start in range(1, N, chunk_size):
+        i = np.arange(start, min(start + chunk_size, N))
+        integral_sum += 2 * float(np.sum(f(a + i * h)))
+
+    integral = integral_sum * (h / 2)
+    return integral
+
+# =====================================================================
+# A2. ADAPTIVE QUADRATURE (TARGET TOLERANCE INSTEAD OF A FIXED N)
+# =====================================================================
+
+# value: the integral, error: estimated absolute error, n_evals: calls to f (nodes)
+IntegrationResult = namedtuple("IntegrationResult", ["value", "error", "n_evals"])
+
+def romberg(f, a, b, tol=1e-10, max_levels=25, min_levels=3, array_aware=None):
+    """
+    Romberg integration: trapezoidal_rule with N = 1, 2, 4, ... intervals, refined by
+    Richardson extrapolation until successive diagonal estimates agree within tol.
+    Each refinement only evaluates f at the new midpoints, so every node is computed once.
+    array_aware, if given, is the known result of is_array_aware for f's array variant.
+    """
+    if a == b: return IntegrationResult(0.0, 0.0, 0)
+
+    array_f = ARRAY_VARIANTS.get(f, f)
+    use_arrays = is_array_aware(array_f, a, b) if array_aware is None else array_aware
+
+    h = b - a
+    previous_row = [(f(a) + f(b)) * (h / 2)]
+    n_evals = 2
+    N = 1
+    error = math.inf
+
+    for level in range(1, max_levels):
+        # Halve h: T(2N) = T(N)/2 + h * (sum of f at the N new midpoints)
+        h /= 2
+        if use_arrays:
+            midpoint_sum = float(np.sum(array_f(a + (2 * np.arange(N) + 1) * h)))
+        else:
+            midpoint_sum = sum(f(a + (2 * i - 1) * h) for i in range(1, N + 1))
+        n_evals += N
+        N *= 2
+
+        # Richardson extrapolation along the new row of the Romberg table
+        row = [previous_row[0] / 2 + h * midpoint_sum]
+        for j in range(1, level + 1):
+            row.append(row[j - 1] + (row[j - 1] - previous_row[j - 1]) / (4**j - 1))
+
+        error = abs(row[-1] - previous_row[-1])
+        previous_row = row
+        if level >= min_levels and error <= tol:
+            break
+
+    return IntegrationResult(previous_row[-1], error, n_evals)
+
+def adaptive_simpson(f, a, b, tol=1e-10, max_depth=50):
+    """
+    Adaptive Simpson's rule: intervals whose two half-interval estimates disagree are
+    split further, so f is sampled densely only where it is hard to integrate.
+    Endpoint and midpoint values are passed down to the halves and never recomputed.
+    """
+    if a == b: return IntegrationResult(0.0, 0.0, 0)
+
+    fa, fm, fb = f(a), f((a + b) / 2), f(b)
+    n_evals = 3
+    value = 0.0
+    error = 0.0
+
+    # Work list of intervals: (a, b, f(a), f(mid), f(b), Simpson estimate, tolerance, depth)
+    stack = [(a, b, fa, fm, fb, (b - a) / 6 * (fa + 4 * fm + fb), tol, 0)]
+    while stack:
+        a, b, fa, fm, fb, whole, tol, depth = stack.pop()
+        m = (a + b) / 2
+        f_left, f_right = f((a + m) / 2), f((m + b) / 2)
+        n_evals += 2
+
+        left = (m - a) / 6 * (fa + 4 * f_left + fm)
+        right = (b - m) / 6 * (fm + 4 * f_right + fb)
+        delta = left + right - whole
+
+        if abs(delta) <= 15 * tol or depth >= max_depth:
+            # Accept, with the Richardson correction delta/15
+            value += left + right + delta / 15
+            error += abs(delta) / 15
+        else:
+            stack.append((m, b, fm, f_right, fb, right, tol / 2, depth + 1))
+            stack.append((a, m, fa, f_left, fm, left, tol / 2, depth + 1))
+
+    return IntegrationResult(value, error, n_evals)
+
 # =====================================================================
 # B. FIVE FUNCTIONS TO INTEGRATE 
 # =====================================================================
@@ -47,6 +173,165 @@ def f_task5_linear(x):
     """Function for Task 5: Integrates 3x + 1."""
     return 3 * x + 1
 
+# =====================================================================
+# B2. ARRAY-CAPABLE VARIANTS (evaluate a whole NumPy array of nodes)
+# =====================================================================
+
+def f_task1_poly_array(x):
+    """Array version of f_task1_poly: x^3 + 2."""
+    return x**3 + 2
+
+def f_task2_trig_cos_array(x):
+    """Array version of f_task2_trig_cos: cos(x)."""
+    return np.cos(x)
+
+def f_task3_exponential_array(x):
+    """Array version of f_task3_exponential: 4e^-x."""
+    return 4 * np.exp(-x)
+
+def f_task4_rational_array(x):
+    """Array version of f_task4_rational: 1/(1+x^2)."""
+    return 1 / (1 + x**2)
+
+def f_task5_linear_array(x):
+    """Array version of f_task5_linear: 3x + 1."""
+    return 3 * x + 1
+
+# Scalar task function -> array-capable variant
+ARRAY_VARIANTS = {
+    f_task1_poly: f_task1_poly_array,
+    f_task2_trig_cos: f_task2_trig_cos_array,
+    f_task3_exponential: f_task3_exponential_array,
+    f_task4_rational: f_task4_rational_array,
+    f_task5_linear: f_task5_linear_array,
+}
+
+# =====================================================================
+# B3. BATCH INTEGRATION (MANY JOBS AT ONCE)
+# =====================================================================
+
+# One row per job, in the order the jobs were given
+BATCH_RESULT_DTYPE = np.dtype([
+    ("job", np.int64),
+    ("value", np.float64),
+    ("exact", np.float64),        # NaN when the job has no exact value
+    ("abs_error", np.float64),    # NaN when the job has no exact value
+    ("wall_time", np.float64),    # seconds
+    ("vectorized", np.bool_),
+])
+
+def _timed_trapezoidal(f, a, b, N):
+    """Process-pool worker: scalar trapezoidal rule plus its wall time."""
+    start = time.perf_counter()
+    value = trapezoidal_rule(f, a, b, N)
+    return value, time.perf_counter() - start
+
+def _integrate_group(f, jobs, chunk_size):
+    """
+    Integrates several (a, b, N) jobs of one array-capable f. Jobs are packed together
+    until chunk_size nodes are collected, and each pack costs a single call to f.
+    Returns a list of (value, wall_time); packed jobs share their pack's time by node count.
+    """
+    results = [None] * len(jobs)
+    pack = []
+
+    def flush():
+        start = time.perf_counter()
+        nodes, weights, offsets = [], [], []
+        n_nodes = 0
+        for k in pack:
+            # Trapezoid weights h/2, h, ..., h, h/2 on the N + 1 nodes
+            a, b, N = jobs[k]
+            h = (b - a) / N
+            w = np.full(N + 1, h)
+            w[0] = w[-1] = h / 2
+            nodes.append(a + np.arange(N + 1) * h)
+            weights.append(w)
+            offsets.append(n_nodes)
+            n_nodes += N + 1
+        values = np.add.reduceat(f(np.concatenate(nodes)) * np.concatenate(weights), offsets)
+        elapsed = time.perf_counter() - start
+        for k, value in zip(pack, values):
+            a, b, N = jobs[k]
+            results[k] = (0.0 if a == b else float(value), elapsed * (N + 1) / n_nodes)
+        pack.clear()
+
+    packed_nodes = 0
+    for k, (a, b, N) in enumerate(jobs):
+        if N + 1 > chunk_size:
+            # Too big to pack: integrate on its own, chunk by chunk
+            start = time.perf_counter()
+            value = trapezoidal_rule_vectorized(f, a, b, N, chunk_size)
+            results[k] = (value, time.perf_counter() - start)
+            continue
+        if packed_nodes + N + 1 > chunk_size:
+            flush()
+            packed_nodes = 0
+        pack.append(k)
+        packed_nodes += N + 1
+    if pack:
+        flush()
+    return results
+
+def integrate_batch(jobs, workers=None, chunk_size=2**20):
+    """
+    Runs many trapezoidal integrations and returns a structured array (BATCH_RESULT_DTYPE).
+
+    Each job is a dict with f_func, a, b, N and optionally exact_val (the same keys as
+    TASKS). Jobs whose integrand is array-capable are grouped by integrand and
+    evaluated vectorised in this process; the rest are spread over a process pool
+    (or run here if their function cannot be pickled, e.g. a lambda).
+    """
+    results = np.zeros(len(jobs), dtype=BATCH_RESULT_DTYPE)
+    results["job"] = np.arange(len(jobs))
+    results["exact"] = [np.nan if job.get("exact_val") is None else job["exact_val"] for job in jobs]
+
+    # Sort the jobs into vectorised groups (keyed by array function) and scalar jobs
+    groups = {}
+    scalar_jobs = []
+    for i, job in enumerate(jobs):
+        f = ARRAY_VARIANTS.get(job["f_func"], job["f_func"])
+        if is_array_aware(f, job["a"], job["b"]):
+            groups.setdefault(f, []).append(i)
+        else:
+            scalar_jobs.append(i)
+
+    def store(i, value, elapsed, vectorized):
+        results[i]["value"] = value
+        results[i]["wall_time"] = elapsed
+        results[i]["vectorized"] = vectorized
+
+    # Scalar jobs go to the pool first so they run while the vectorised groups are computed
+    picklable = []
+    for i in scalar_jobs:
+        try:
+            pickle.dumps(jobs[i]["f_func"])
+            picklable.append(i)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            store(i, *_timed_trapezoidal(jobs[i]["f_func"], jobs[i]["a"], jobs[i]["b"], jobs[i]["N"]), False)
+
+    pool = None
+    futures = []
+    if picklable:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+        futures = [(i, pool.submit(_timed_trapezoidal, jobs[i]["f_func"], jobs[i]["a"], jobs[i]["b"], jobs[i]["N"]))
+                   for i in picklable]
+
+    try:
+        for f, indices in groups.items():
+            group_jobs = [(jobs[i]["a"], jobs[i]["b"], jobs[i]["N"]) for i in indices]
+            for i, (value, elapsed) in zip(indices, _integrate_group(f, group_jobs, chunk_size)):
+                store(i, value, elapsed, True)
+        for i, future in futures:
+            store(i, *future.result(), False)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    results["abs_error"] = np.abs(results["value"] - results["exact"])
+    return results
+
 # =====================================================================
 # C. SINGLE EXECUTION BLOCK (ALL TASKS CONSOLIDATED)
 # =====================================================================
@@ -54,7 +339,10 @@ def f_task5_linear(x):
 def execute_task(task_num, f_func, a, b, N, f_str, exact_val):
     """Helper function to run the trapezoidal rule and print formatted output."""
     result = trapezoidal_rule(f_func, a, b, N)
-    
+    print_task_result(task_num, a, b, N, f_str, exact_val, result)
+
+def print_task_result(task_num, a, b, N, f_str, exact_val, result, **_):
+    """Prints one task's integral in the laboratory report format."""
     print(f"\n==================================================")
     print(f"--- TASK {task_num}/5: NUMERICAL INTEGRATION ---")
     print(f"Function: {f_str}")
@@ -68,52 +356,189 @@ def execute_task(task_num, f_func, a, b, N, f_str, exact_val):
         print(f"Absolute Error: {error:.8f}")
     print(f"==================================================")
 
+# The five laboratory tasks (keyword arguments for execute_task)
+TASKS = [
+    dict(task_num=1, f_func=f_task1_poly, a=1.0, b=3.0, N=2,
+         f_str="f(x) = x^3 + 2",
+         exact_val=24.0), # Exact integral of x^3 + 2 from 1 to 3
+    dict(task_num=2, f_func=f_task2_trig_cos, a=0.0, b=math.pi, N=4,
+         f_str="f(x) = cos(x)",
+         exact_val=0.0), # Integral of cos(x) from 0 to pi
+    dict(task_num=3, f_func=f_task3_exponential, a=4, b=8, N=2,
+         f_str="f(x) = 4e^-x",
+         exact_val=4*math.exp(-4) - 4*math.exp(-8)), # Exact integral of 4e^-x from 4 to 8
+    dict(task_num=4, f_func=f_task4_rational, a=5, b=11, N=4,
+         f_str="f(x) = 1/(1+x^2)",
+         exact_val=math.atan(11) - math.atan(5)), # Exact integral of 1/(1+x^2) from 5 to 11
+    dict(task_num=5, f_func=f_task5_linear, a=7, b=18, N=500,
+         f_str="f(x) = 3x + 1",
+         exact_val=847/2), # Exact integral of 3x + 1 from 7 to 18
+]
+
+def execute_adaptive(task, tol=1e-10):
+    """Runs both adaptive methods on one task and prints value, error estimate and cost."""
+    print(f"\n--- TASK {task['task_num']}/5: ADAPTIVE INTEGRATION (tol = {tol:g}) ---")
+    print(f"Function: {task['f_str']} on [{task['a']}, {task['b']}]")
+    for name, method in (("Romberg", romberg), ("Adaptive Simpson", adaptive_simpson)):
+        result = method(task['f_func'], task['a'], task['b'], tol=tol)
+        true_error = abs(result.value - task['exact_val'])
+        print(f"{name:>16}: {result.value:.12f}  est. error {result.error:.2e}  "
+              f"true error {true_error:.2e}  f calls {result.n_evals}")
+
+# =====================================================================
+# D. BENCHMARK AND CONVERGENCE PROFILING
+# =====================================================================
+
+class CountingFunction:
+    """Wraps an integrand and counts how many points it is evaluated at (array calls count every node)."""
+
+    def __init__(self, f):
+        self.f = f
+        self.n_evals = 0
+
+    def __call__(self, x):
+        self.n_evals += np.size(x)
+        return self.f(x)
+
+def convergence_order(sizes, errors):
+    """
+    Empirical order p in error ~ size^-p (size = N, or f evaluations for adaptive runs),
+    from a least-squares fit on a log-log scale. Errors at the rounding floor are left
+    out; None if fewer than two points remain.
+    """
+    points = [(n, e) for n, e in zip(sizes, errors) if e > 1e-13]
+    if len(points) < 2:
+        return None
+    slope = np.polyfit(np.log([n for n, _ in points]), np.log([e for _, e in points]), 1)[0]
+    return float(-slope)
+
+def _benchmark_run(method, task, repeats, array_variant=False):
+    """
+    Best-of-repeats wall time of one integration, with its evaluation count and error.
+    method(f, array_aware) is handed the counted integrand and the result of probing
+    the uncounted one with is_array_aware, so the probe is neither counted nor timed.
+    """
+    f = task["f_func"]
+    if array_variant:
+        f = ARRAY_VARIANTS.get(f, f)
+    array_aware = is_array_aware(f, task["a"], task["b"])
+
+    best = math.inf
+    for _ in range(repeats):
+        counted = CountingFunction(f)
+        start = time.perf_counter()
+        value = method(counted, array_aware)
+        best = min(best, time.perf_counter() - start)
+    return {"wall_time": best, "n_evals": counted.n_evals, "value": value,
+            "error": abs(value - task["exact_val"])}
+
+def _romberg_up_to(f, a, b, N, array_aware=None):
+    """
+    Romberg table up to N intervals, as (value, intervals reached): with tol=0 it still
+    stops early once successive extrapolations agree exactly (e.g. for polynomials).
+    """
+    result = romberg(f, a, b, tol=0.0, max_levels=int(math.log2(N)) + 1, min_levels=0,
+                     array_aware=array_aware)
+    return result.value, result.n_evals - 1
+
+def run_benchmark(powers=range(1, 17), tolerances=(1e-2, 1e-4, 1e-6, 1e-8, 1e-10, 1e-12),
+                  repeats=3, tasks=None):
+    """
+    Integrates every task with each backend and returns a JSON-ready report.
+
+    The fixed-N backends (scalar loop, vectorised, Romberg with the same number of
+    intervals) run at N = 2^k for k in powers; adaptive Simpson runs at each tolerance.
+    Each entry records wall time, f evaluations and absolute error per run, plus the
+    fitted convergence order of the error against N (adaptive: against f evaluations).
+    """
+    tasks = TASKS if tasks is None else tasks
+    # name: (method returning (value, N actually used), give it the array-capable variant of f)
+    fixed_n_backends = {
+        "scalar": (lambda f, a, b, N, array_aware: (trapezoidal_rule(f, a, b, N), N), False),
+        "vectorized": (lambda f, a, b, N, array_aware: (
+            trapezoidal_rule_vectorized(f, a, b, N, array_aware=array_aware), N), True),
+        "romberg": (_romberg_up_to, True),
+    }
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "repeats": repeats,
+        },
+        "results": [],
+    }
+
+    for task in tasks:
+        a, b = task["a"], task["b"]
+        for backend, (method, array_variant) in fixed_n_backends.items():
+            runs = []
+            for k in powers:
+                reached = {}
+                def integrate(f, array_aware, method=method, N=2**k):
+                    value, reached["N"] = method(f, a, b, N, array_aware)
+                    return value
+                run = _benchmark_run(integrate, task, repeats, array_variant)
+                runs.append({"N": reached["N"], **run})
+            report["results"].append(_benchmark_entry(task, backend, runs))
+
+        runs = []
+        for tol in tolerances:
+            run = _benchmark_run(lambda f, array_aware: adaptive_simpson(f, a, b, tol=tol).value, task, repeats)
+            runs.append({"tol": tol, **run})
+        report["results"].append(_benchmark_entry(task, "adaptive_simpson", runs))
+
+    return report
+
+def _benchmark_entry(task, backend, runs):
+    sizes = [r.get("N", r["n_evals"]) for r in runs]
+    return {
+        "task": task["task_num"],
+        "function": task["f_str"],
+        "interval": [task["a"], task["b"]],
+        "backend": backend,
+        "convergence_order": convergence_order(sizes, [r["error"] for r in runs]),
+        "runs": runs,
+    }
+
+def print_benchmark_summary(report):
+    """One line per task and backend: fitted order and the cost of the most accurate run."""
+    print(f"\n{'Task':>4}  {'Backend':<17}{'Order':>7}{'Best error':>12}{'f evals':>10}{'Time (s)':>11}")
+    for entry in report["results"]:
+        last = entry["runs"][-1]
+        order = "n/a" if entry["convergence_order"] is None else f"{entry['convergence_order']:.2f}"
+        print(f"{entry['task']:>4}  {entry['backend']:<17}{order:>7}{last['error']:>12.2e}"
+              f"{last['n_evals']:>10}{last['wall_time']:>11.2e}")
+
 if __name__ == "__main__":
+
+    # Only the script needs argument parsing; importing the module as a library skips it
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Numerical integration by the trapezoidal rule.")
+    parser.add_argument("--benchmark", metavar="JSON", help="profile every backend and write the report to this file")
+    parser.add_argument("--max-power", type=int, default=16, help="largest N = 2^k used by the benchmark")
+    parser.add_argument("--repeats", type=int, default=3, help="timing repeats per benchmark run (best is kept)")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        report = run_benchmark(powers=range(1, args.max_power + 1), repeats=args.repeats)
+        with open(args.benchmark, "w") as fh:
+            json.dump(report, fh, indent=2)
+        print_benchmark_summary(report)
+        print(f"\nBenchmark report written to {args.benchmark}")
+
+    else:
+        print("--- Laboratory 8 - 2: Numerical Integration by Trapezoidal Rule ---")
     
-    print("--- Laboratory 8 - 2: Numerical Integration by Trapezoidal Rule ---")
-    
-    # --- TASK 1 Execution ---
-    execute_task(
-        task_num=1,
-        f_func=f_task1_poly,
-        a=1.0, b=3.0, N=2,
-        f_str="f(x) = x^3 + 2",
-        exact_val=24.0 # Exact integral of x^3 + 2 from 1 to 3
-    )
-
-    # --- TASK 2 Execution ---
-    execute_task(
-        task_num=2,
-        f_func=f_task2_trig_cos,
-        a=0.0, b=math.pi, N=4,
-        f_str="f(x) = cos(x)",
-        exact_val=0.0 # Integral of cos(x) from 0 to pi
-    )
-
-    # --- TASK 3 Execution ---
-    execute_task(
-        task_num=3,
-        f_func=f_task3_exponential,
-        a=4, b=8, N=2,
-        f_str="f(x) = 4e^-x",
-        exact_val=4*math.exp(-4) - 4*math.exp(-8) # Exact integral of 4e^-x from 4 to 8
-    )
-
-        # --- TASK 4 Execution ---
-    execute_task(
-        task_num=4,
-        f_func=f_task4_rational,
-        a=5, b=11, N=4,
-        f_str="f(x) = 1/(1+x^2)",
-        exact_val=math.atan(11) - math.atan(5) # Exact integral of 1/(1+x^2) from 5 to 11
-    )
-
-            # --- TASK 5 Execution ---
-    execute_task(
-        task_num=5,
-        f_func=f_task5_linear,
-        a=7, b=18, N=500,
-        f_str="f(x) = 1/(1+x^2)",
-        exact_val=847/2 # Exact integral of 3x + 1 from 7 to 18
-    )
+        # --- TASKS 1-5 Execution (as one batch) ---
+        batch = integrate_batch(TASKS)
+        for task, row in zip(TASKS, batch):
+            print_task_result(result=row["value"], **task)
+
+        print(f"\nBatch wall time per job (s): {', '.join(f'{t:.2e}' for t in batch['wall_time'])}")
 
+        # --- The same integrals to a target accuracy, with N chosen automatically ---
+        for task in TASKS:
+            execute_adaptive(task)
@@ -1,5 +1,13 @@
 #Importing Essential Libraries
 import math 
+import io
+import json
+import os
+import time
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+import numpy as np
 
 # --- 0. Initialise State Variables ---
 t = 0
@@ -62,7 +70,7 @@ def calculate_rates(state):
     if V_rel_mag == 0:
         drag_factor = 0.0
     else:
-        drag_factor = -0.5 * RHO * Cd * A / M * V_rel_mag
+        drag_factor = -DRAG_MODEL.drag_factor(y, V_rel_mag) * V_rel_mag
 
     # Drag acceleration components
     ax_drag = drag_factor * vx_rel
@@ -75,6 +83,157 @@ def calculate_rates(state):
     # The rates of change (dS/dt)
     return [vx, vy, ax, ay]
 
+# --- 4. Atmosphere and Drag Models ---
+
+# Approximate drag curve of a smooth sphere (round shot): (Mach number, Cd)
+SPHERE_CD_TABLE = (
+    (0.0, 0.47), (0.5, 0.48), (0.6, 0.50), (0.7, 0.54), (0.8, 0.61), (0.9, 0.72),
+    (1.0, 0.86), (1.1, 0.95), (1.2, 0.99), (1.4, 1.01), (1.6, 1.00), (2.0, 0.97),
+    (2.5, 0.94), (3.0, 0.92),
+)
+
+@lru_cache(maxsize=16)
+def isa_table(max_altitude=20000.0, step=10.0):
+    """
+    International Standard Atmosphere sampled every `step` metres from sea level.
+    Returns (altitudes, densities, speeds_of_sound); cached, so every drag model built
+    with the same resolution shares one copy.
+    """
+    R_AIR = 287.05287       # specific gas constant of dry air (J/(kg K))
+    LAPSE = 0.0065          # troposphere temperature lapse rate (K/m)
+    T_SL, P_SL = 288.15, 101325.0
+    T_TROPOPAUSE = T_SL - LAPSE * 11000.0
+
+    h = np.arange(0.0, max_altitude + step, step)
+
+    # Troposphere (up to 11 km), then the isothermal lower stratosphere
+    T = np.maximum(T_SL - LAPSE * h, T_TROPOPAUSE)
+    P = P_SL * (T / T_SL) ** (G / (LAPSE * R_AIR))
+    above = h > 11000.0
+    P[above] *= np.exp(-G * (h[above] - 11000.0) / (R_AIR * T_TROPOPAUSE))
+
+    return h, P / (R_AIR * T), np.sqrt(1.4 * R_AIR * T)
+
+@lru_cache(maxsize=16)
+def uniform_table(points, step):
+    """Resamples a tuple of (x, y) breakpoints onto an evenly spaced grid (cached)."""
+    xs, ys = np.array(points).T
+    grid = np.arange(xs[0], xs[-1] + step, step)
+    return grid, np.interp(grid, xs, ys)
+
+class ConstantDrag:
+    """The original model: constant air density RHO and drag coefficient Cd."""
+
+    name = 'constant'
+
+    def __init__(self, rho=RHO, cd=Cd):
+        self._k = 0.5 * rho * cd * A / M
+
+    def drag_factor(self, altitude, speed):
+        """Returns 0.5 * rho * Cd * A / M (drag acceleration = factor * speed^2)."""
+        return self._k
+
+    def drag_factor_array(self, altitude, speed):
+        """Array version of drag_factor (a scalar here, broadcast by the caller)."""
+        return self._k
+
+class TabulatedDrag:
+    """
+    ISA air density and speed of sound varying with altitude, with Cd looked up from a
+    Cd(Mach) curve. Both come from evenly spaced precomputed tables, so a lookup is an
+    index calculation and a linear interpolation instead of evaluating the atmosphere
+    formulas inside every RK stage.
+    """
+
+    name = 'isa'
+
+    def __init__(self, cd_table=SPHERE_CD_TABLE, altitude_step=10.0, max_altitude=20000.0,
+                 mach_step=0.01):
+        h, rho, sound = isa_table(max_altitude, altitude_step)
+        mach, cd = uniform_table(tuple(cd_table), mach_step)
+
+        self._h, self._mach, self._cd = h, mach, cd
+        self._rho_k = 0.5 * A / M * rho          # density pre-multiplied by 0.5 * A / M
+        self._inv_sound = 1.0 / sound
+
+        # Plain lists and scalars for the scalar path
+        self._rho_k_list = self._rho_k.tolist()
+        self._inv_sound_list = self._inv_sound.tolist()
+        self._cd_list = cd.tolist()
+        self._inv_dh = 1.0 / altitude_step
+        self._mach0 = float(mach[0])
+        self._inv_dm = 1.0 / mach_step
+        self._h_last = len(h) - 1
+        self._m_last = len(mach) - 1
+
+    def drag_factor(self, altitude, speed):
+        """Returns 0.5 * rho(altitude) * Cd(Mach) * A / M for one state."""
+
+        # Altitude row (clamped to the table) and fraction towards the next row
+        u = altitude * self._inv_dh
+        if u <= 0:
+            i, f = 0, 0.0
+        elif u >= self._h_last:
+            i, f = self._h_last - 1, 1.0
+        else:
+            i = int(u)
+            f = u - i
+        rho_k = self._rho_k_list[i] + f * (self._rho_k_list[i + 1] - self._rho_k_list[i])
+        inv_sound = self._inv_sound_list[i] + f * (self._inv_sound_list[i + 1] - self._inv_sound_list[i])
+
+        # Cd at this Mach number (held constant beyond either end of the curve, like np.interp)
+        u = (speed * inv_sound - self._mach0) * self._inv_dm
+        if u <= 0:
+            cd = self._cd_list[0]
+        elif u >= self._m_last:
+            cd = self._cd_list[-1]
+        else:
+            j = int(u)
+            cd = self._cd_list[j] + (u - j) * (self._cd_list[j + 1] - self._cd_list[j])
+
+        return rho_k * cd
+
+    def drag_factor_array(self, altitude, speed):
+        """Array version of drag_factor."""
+        rho_k = np.interp(altitude, self._h, self._rho_k)
+        mach = speed * np.interp(altitude, self._h, self._inv_sound)
+        return rho_k * np.interp(mach, self._mach, self._cd)
+
+DRAG_MODELS = {'constant': ConstantDrag, 'isa': TabulatedDrag}
+
+# Active drag model used by calculate_rates and the integrators
+DRAG_MODEL = ConstantDrag()
+
+def benchmark_drag_models(n_calls=200000, n_shots=100000):
+    """Times calculate_rates and one ensemble RK4 step under each drag model."""
+    state = [1000.0, 500.0, 300.0, 50.0]
+    S = np.empty((n_shots, 4), order='F')
+    S[:] = state
+
+    global DRAG_MODEL
+    saved_model = DRAG_MODEL
+    baseline = None
+    print(f"\n--- Drag Model Overhead ---")
+    try:
+        for name, model_class in DRAG_MODELS.items():
+            DRAG_MODEL = model_class()
+            start = time.perf_counter()
+            for _ in range(n_calls):
+                calculate_rates(state)
+            scalar_us = (time.perf_counter() - start) / n_calls * 1e6
+
+            ensemble_ms = float('inf')
+            for _ in range(5):
+                start = time.perf_counter()
+                rk4_step_ensemble(S, time_step, WIND_X, WIND_Y)
+                ensemble_ms = min(ensemble_ms, (time.perf_counter() - start) * 1e3)
+
+            baseline = baseline or (scalar_us, ensemble_ms)
+            print(f"{name:>9}: calculate_rates {scalar_us:6.3f} us/call ({scalar_us / baseline[0]:.2f}x), "
+                  f"ensemble step {ensemble_ms:7.2f} ms for {n_shots} shots ({ensemble_ms / baseline[1]:.2f}x)")
+    finally:
+        DRAG_MODEL = saved_model
+
 # --- 5. Runge-Kutta 4 (RK4) Step ---
 
 def rk4_step(S, t, dt):
@@ -112,6 +271,134 @@ def rk4_step(S, t, dt):
 
     return S_new
 
+# --- 5b. In-Place RK4 Stepper and Trajectory Recording ---
+
+def calculate_rates_into(state, out):
+    """Same physics as calculate_rates, but writes (vx, vy, ax, ay) into the buffer out."""
+    x, y, vx, vy = state
+
+    vx_rel = vx - WIND_X
+    vy_rel = vy - WIND_Y
+    V_rel_mag = math.sqrt(vx_rel**2 + vy_rel**2)
+
+    if V_rel_mag == 0:
+        drag_factor = 0.0
+    else:
+        drag_factor = -DRAG_MODEL.drag_factor(y, V_rel_mag) * V_rel_mag
+
+    out[0] = vx
+    out[1] = vy
+    out[2] = drag_factor * vx_rel
+    out[3] = drag_factor * vy_rel - G
+
+class RK4Stepper:
+    """
+    Fixed-step RK4 integrator that advances a state in place. The stage rates and the
+    intermediate state live in buffers allocated once, so stepping allocates nothing.
+    """
+
+    def __init__(self, dt=time_step):
+        self.dt = dt
+        self._k1 = array('d', [0.0] * 4)
+        self._k2 = array('d', [0.0] * 4)
+        self._k3 = array('d', [0.0] * 4)
+        self._k4 = array('d', [0.0] * 4)
+        self._S_mid = array('d', [0.0] * 4)
+
+    def step(self, S):
+        """Advances S (an array('d') or list of 4 floats) by one time step, in place."""
+        dt = self.dt
+        k1, k2, k3, k4, S_mid = self._k1, self._k2, self._k3, self._k4, self._S_mid
+        x, y, vx, vy = S
+
+        # K1: Rate at start of interval, then S_mid_1 = S + k1/2
+        calculate_rates_into(S, k1)
+        k1x, k1y, k1vx, k1vy = dt * k1[0], dt * k1[1], dt * k1[2], dt * k1[3]
+        S_mid[0], S_mid[1], S_mid[2], S_mid[3] = x + k1x/2, y + k1y/2, vx + k1vx/2, vy + k1vy/2
+
+        # K2: Rate at midpoint 1, then S_mid_2 = S + k2/2
+        calculate_rates_into(S_mid, k2)
+        k2x, k2y, k2vx, k2vy = dt * k2[0], dt * k2[1], dt * k2[2], dt * k2[3]
+        S_mid[0], S_mid[1], S_mid[2], S_mid[3] = x + k2x/2, y + k2y/2, vx + k2vx/2, vy + k2vy/2
+
+        # K3: Rate at midpoint 2, then S_end = S + k3
+        calculate_rates_into(S_mid, k3)
+        k3x, k3y, k3vx, k3vy = dt * k3[0], dt * k3[1], dt * k3[2], dt * k3[3]
+        S_mid[0], S_mid[1], S_mid[2], S_mid[3] = x + k3x, y + k3y, vx + k3vx, vy + k3vy
+
+        # K4: Rate at end of interval, then S_new = S + (1/6) * (k1 + 2*k2 + 2*k3 + k4)
+        calculate_rates_into(S_mid, k4)
+        S[0] = x + (1/6) * (k1x + 2*k2x + 2*k3x + dt * k4[0])
+        S[1] = y + (1/6) * (k1y + 2*k2y + 2*k3y + dt * k4[1])
+        S[2] = vx + (1/6) * (k1vx + 2*k2vx + 2*k3vx + dt * k4[2])
+        S[3] = vy + (1/6) * (k1vy + 2*k2vy + 2*k3vy + dt * k4[3])
+
+class TrajectoryRecorder:
+    """
+    Collects (t, x, y) samples of a trajectory.
+
+    - every: keep only every n-th step (the final state is always kept)
+    - capacity: keep only the most recent samples in a fixed-size ring buffer
+    - sink: pass each kept sample to sink(t, x, y) instead of storing it
+    Without a capacity, samples are appended to compact array('d') columns.
+    """
+
+    def __init__(self, every=1, capacity=None, sink=None):
+        self.every = every
+        self.capacity = capacity
+        self.sink = sink
+        self._steps = 0
+        self._head = 0
+        self._size = 0
+
+        size = capacity or 0
+        self._t = array('d', [0.0] * size)
+        self._x = array('d', [0.0] * size)
+        self._y = array('d', [0.0] * size)
+
+    def record(self, t, S):
+        """Offers the state after one step; stored if it falls on the decimation grid."""
+        step = self._steps
+        self._steps += 1
+        if step % self.every == 0:
+            self._store(t, S[0], S[1])
+
+    def finish(self, t, S):
+        """Stores the final state if decimation skipped it."""
+        if (self._steps - 1) % self.every != 0:
+            self._store(t, S[0], S[1])
+
+    def _store(self, t, x, y):
+        if self.sink is not None:
+            self.sink(t, x, y)
+        elif self.capacity is None:
+            self._t.append(t)
+            self._x.append(x)
+            self._y.append(y)
+        else:
+            # Overwrite the oldest sample once the ring buffer is full
+            head = self._head
+            self._t[head] = t
+            self._x[head] = x
+            self._y[head] = y
+            self._head = (head + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def _order(self):
+        # Storage indices of the kept samples, oldest first
+        if self.capacity is None:
+            return range(len(self._t))
+        start = (self._head - self._size) % self.capacity
+        return [(start + i) % self.capacity for i in range(self._size)]
+
+    def points(self):
+        """Kept (x, y) positions, oldest first."""
+        return [(self._x[i], self._y[i]) for i in self._order()]
+
+    def samples(self):
+        """Kept (t, x, y) samples, oldest first."""
+        return [(self._t[i], self._x[i], self._y[i]) for i in self._order()]
+
 # --- 6. Terrain Model (Geometry) ---
 
 # Define the terrain profile for Waterloo as a list of (x, y) coordinates (meters)
@@ -124,84 +411,485 @@ TERRAIN_POINTS = [
     (3000.0, 55.0)      # Final ground altitude
 ]
 
+class Terrain:
+    """
+    Piecewise-linear terrain profile through a list of (x, y) survey points.
+
+    The slope of every segment is precomputed, segments are found by binary search,
+    and the last segment used is remembered so that the steadily increasing x of a
+    trajectory is usually answered without searching at all. Heights are clamped to
+    the first/last point outside the surveyed range.
+    """
+
+    def __init__(self, points):
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        if len(points) == 0:
+            raise ValueError("Terrain needs at least one (x, y) point.")
+
+        xs = points[:, 0]
+        ys = points[:, 1]
+        if np.any(np.diff(xs) < 0):
+            raise ValueError("Terrain x coordinates must be in increasing order.")
+
+        # y = y_i + slope_i * (x - x_i) on segment i (between point i and point i+1).
+        # Measuring from the segment start keeps full precision far from x = 0.
+        # Zero-length segments (vertical steps) are never selected by the search.
+        dx = np.diff(xs)
+        slopes = np.divide(np.diff(ys), dx, out=np.zeros_like(dx), where=dx > 0)
+
+        # NumPy copies for batch queries, plain lists for fast scalar queries
+        self.x_points = np.array(xs)
+        self.y_points = np.array(ys)
+        self.slopes = slopes
+        self._xs = xs.tolist()
+        self._ys = ys.tolist()
+        self._slopes = slopes.tolist()
+        self._x_start, self._x_end = self._xs[0], self._xs[-1]
+        self._y_start, self._y_end = float(ys[0]), float(ys[-1])
+        self._hint = 0
+
+    @classmethod
+    def from_csv(cls, path, delimiter=",", skiprows=0):
+        """Loads a profile from a text file with one 'x, y' pair per line."""
+        return cls(np.loadtxt(path, delimiter=delimiter, skiprows=skiprows, ndmin=2))
+
+    @classmethod
+    def from_binary(cls, path, dtype="<f8"):
+        """
+        Loads a profile from a memory-mapped binary file: either a .npy file holding an
+        (n, 2) array, or a raw dump of interleaved x, y values of the given dtype.
+        """
+        if str(path).endswith(".npy"):
+            points = np.load(path, mmap_mode="r")
+        else:
+            points = np.memmap(path, dtype=dtype, mode="r")
+        return cls(points)
+
+    @property
+    def x_end(self):
+        """Horizontal position of the last survey point."""
+        return self._x_end
+
+    def height(self, x):
+        """Terrain height at a single horizontal position x."""
+
+        # 1. Edge Cases: before the start or beyond the last point
+        if x <= self._x_start:
+            return self._y_start
+        if x >= self._x_end:
+            return self._y_end
+
+        # 2. Find the segment: try the previous one and its neighbour before searching
+        xs = self._xs
+        i = self._hint
+        if not xs[i] <= x < xs[i + 1]:
+            if xs[i + 1] <= x < xs[min(i + 2, len(xs) - 1)]:
+                i += 1
+            else:
+                i = bisect_right(xs, x) - 1
+            self._hint = i
+
+        return self._ys[i] + self._slopes[i] * (x - xs[i])
+
+    def height_array(self, x):
+        """Terrain heights for an array of horizontal positions (one binary search each)."""
+        x = np.asarray(x, dtype=float)
+        if len(self._xs) == 1:
+            return np.full_like(x, self._y_start)
+
+        i = np.searchsorted(self.x_points, x, side="right") - 1
+        np.clip(i, 0, len(self.slopes) - 1, out=i)
+        y = self.y_points[i] + self.slopes[i] * (x - self.x_points[i])
+
+        y = np.where(x <= self._x_start, self._y_start, y)
+        return np.where(x >= self._x_end, self._y_end, y)
+
+    def __call__(self, x):
+        if np.ndim(x) == 0:
+            return self.height(x)
+        return self.height_array(x)
+
+# Active terrain profile. Replace it (e.g. TERRAIN = Terrain.from_csv("survey.csv"))
+# to run the simulation over a different battlefield.
+TERRAIN = Terrain(TERRAIN_POINTS)
+
 def terrain(x):
     """Calculates terrain height at horizontal position x using linear interpolation."""
+    return TERRAIN.height(x)
 
-    # 1. Edge Case: Before the start
-    if x <= TERRAIN_POINTS[0][0]:
-        return TERRAIN_POINTS[0][1]
-    
-    # 2. Find the correct segment
-    for i in range(len(TERRAIN_POINTS) - 1):
-        xa, ya = TERRAIN_POINTS[i]
-        xb, yb = TERRAIN_POINTS[i+1]
-
-        if x < xb: 
-            #Linear interpolation method formula 
-            y_terrain = ya + (yb - ya) * ((x - xa) / (xb - xa))
-            return y_terrain
-        
-    # 3. Edge Case: Beyond the last point
-    return TERRAIN_POINTS[-1][1]
-
-# --- 7. Simulation Loop and Output ---
-
-# List to store trajectory points for plotting
-trajectory = [(x0, y0)]
-
-# Run the simulation until the cannonball's height (S[1]) is less than or equal to the terrain height
-# S[0] is x, S[1] is y
-while S[1] >= terrain(S[0]):
-
-    # Safety Check: Limit flight time to prevent infinite loops (e.g., if the cannon shoots straight up)
-    if t > 60: #Max 60s flight time
-        print("\nSimulation aborted: Flight time exceeded 60 seconds.")
-        break
+def terrain_array(x):
+    """Vectorised terrain(): heights for an array of horizontal positions."""
+    return TERRAIN.height_array(x)
+
+# --- 7. Ensemble Mode (Many Shots at Once) ---
 
-    # Advance the state using RK4
-    S = rk4_step(S, t, time_step)
-    t += time_step
+def drag_acceleration_ensemble(y, vx, vy, wind_x, wind_y, drag_model):
+    """Net acceleration (ax, ay) for arrays of altitudes and velocities (drag + gravity)."""
 
-    # Store the new position
-    trajectory.append((S[0], S[1]))
+    # Relative velocity and its magnitude for every shot
+    vx_rel = vx - wind_x
+    vy_rel = vy - wind_y
+    V_rel_mag = np.sqrt(vx_rel*vx_rel + vy_rel*vy_rel)
 
-# --- 8. Final Results and Visualization ---
+    # Same drag law as calculate_rates (a zero relative speed gives zero drag automatically)
+    drag_factor = V_rel_mag * -drag_model.drag_factor_array(y, V_rel_mag)
 
-final_range = S[0]
-print(f"\n--- Simulation Results ---")
-print(f"Launch Angle: {ANGLE_DEG} degrees")
-print(f"Final Horizontal Range: {final_range:.2f} meters")
-print(f"Final Flight Time: {t:.2f} seconds")
-print(f"Note: Drag and Wind Factors included in calculations.")
-print("\n")
+    vx_rel *= drag_factor
+    vy_rel *= drag_factor
+    vy_rel -= G
+    return vx_rel, vy_rel
+
+def rk4_step_ensemble(S, dt, wind_x, wind_y, drag_model=None):
+    """
+    Performs one RK4 step on every row of the (N, 4) state array S.
+
+    The position rates are the velocities, so the position stages follow directly
+    from the velocity stages and only four drag evaluations are needed.
+    """
+    drag_model = drag_model or DRAG_MODEL
+    x, y, vx, vy = S[:, 0], S[:, 1], S[:, 2], S[:, 3]
+    half = dt / 2
+
+    # K1..K4 for the velocity components (the altitude is only needed by the drag model)
+    k1x, k1y = drag_acceleration_ensemble(y, vx, vy, wind_x, wind_y, drag_model)
+    vx2 = vx + half * k1x
+    vy2 = vy + half * k1y
+    k2x, k2y = drag_acceleration_ensemble(y + half * vy, vx2, vy2, wind_x, wind_y, drag_model)
+    vx3 = vx + half * k2x
+    vy3 = vy + half * k2y
+    k3x, k3y = drag_acceleration_ensemble(y + half * vy2, vx3, vy3, wind_x, wind_y, drag_model)
+    vx4 = vx + dt * k3x
+    vy4 = vy + dt * k3y
+    k4x, k4y = drag_acceleration_ensemble(y + dt * vy3, vx4, vy4, wind_x, wind_y, drag_model)
+
+    # Weighted averages: S_new = S + (dt/6) * (k1 + 2*k2 + 2*k3 + k4)
+    S_new = np.empty_like(S)
+    S_new[:, 0] = x + (dt / 6) * (vx + 2*(vx2 + vx3) + vx4)
+    S_new[:, 1] = y + (dt / 6) * (vy + 2*(vy2 + vy3) + vy4)
+    S_new[:, 2] = vx + (dt / 6) * (k1x + 2*(k2x + k3x) + k4x)
+    S_new[:, 3] = vy + (dt / 6) * (k1y + 2*(k2y + k3y) + k4y)
+    return S_new
 
-# --- Matplotlib Plotting ---
-try:
-    import matplotlib.pyplot as plt
+def simulate_ensemble(angles_deg, v0=V0, wind_x=WIND_X, wind_y=WIND_Y,
+                      dt=time_step, max_time=60.0, x_start=x0, y_start=y0,
+                      block_size=4096, drag_model=None):
+    """
+    Integrates N cannon shots together with RK4, using the same stopping rule as the
+    single-shot loop: each shot stops on the first step that ends below terrain().
+
+    angles_deg, v0, wind_x and wind_y may be scalars or arrays; they are broadcast
+    against each other to give one shot per element. Shots are integrated in blocks
+    of block_size so that the working arrays stay in the CPU cache. drag_model
+    defaults to the module's DRAG_MODEL.
+
+    Returns a dict of length-N arrays:
+    - 'range': horizontal distance travelled from the launch point (m)
+    - 'flight_time': time of flight (s)
+    - 'impact_x', 'impact_y': impact point on the terrain profile (m)
+    - 'landed': False for shots stopped by the max_time safety limit
+    """
+    angles_deg, v0, wind_x, wind_y = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (angles_deg, v0, wind_x, wind_y)))
+    angles_rad = np.radians(angles_deg.ravel())
+    v0 = v0.ravel()
+    wind_x = wind_x.ravel()
+    wind_y = wind_y.ravel()
+    n_shots = angles_rad.size
+
+    impact_x = np.empty(n_shots)
+    flight_time = np.empty(n_shots)
+    landed = np.zeros(n_shots, dtype=bool)
+
+    for start in range(0, n_shots, block_size):
+        block = slice(start, start + block_size)
+
+        # Initial (n, 4) state array. Column-major so each state variable is contiguous.
+        S = np.empty((angles_rad[block].size, 4), order='F')
+        S[:, 0] = x_start
+        S[:, 1] = y_start
+        S[:, 2] = v0[block] * np.cos(angles_rad[block])
+        S[:, 3] = v0[block] * np.sin(angles_rad[block])
+
+        _integrate_block(S, wind_x[block].copy(), wind_y[block].copy(), dt, max_time,
+                         drag_model or DRAG_MODEL,
+                         impact_x[block], flight_time[block], landed[block])
+
+    return {
+        'range': impact_x - x_start,
+        'flight_time': flight_time,
+        'impact_x': impact_x,
+        'impact_y': terrain_array(impact_x),
+        'landed': landed,
+    }
+
+def _integrate_block(S, wind_x, wind_y, dt, max_time, drag_model, impact_x, flight_time, landed):
+    """Steps one block of shots until all have landed, writing into the output views."""
+
+    # Rows still being integrated: their index within the block
+    active = np.arange(S.shape[0])
+    in_flight = np.ones(S.shape[0], dtype=bool)
+
+    t = 0.0
+    while True:
+
+        # Record every shot that has just gone below the terrain
+        below = in_flight & (S[:, 1] < terrain_array(S[:, 0]))
+        if below.any():
+            done = active[below]
+            impact_x[done] = S[below, 0]
+            flight_time[done] = t
+            landed[done] = True
+            in_flight &= ~below
+
+            # Landed rows keep being stepped (harmlessly) until enough of them
+            # have built up to make compacting the arrays worthwhile
+            n_flying = np.count_nonzero(in_flight)
+            if n_flying == 0:
+                return
+            if n_flying < 0.875 * active.size:
+                S = np.asfortranarray(S[in_flight])
+                active = active[in_flight]
+                wind_x = wind_x[in_flight]
+                wind_y = wind_y[in_flight]
+                in_flight = np.ones(active.size, dtype=bool)
+
+        # Safety Check: same flight time limit as the single-shot loop
+        if t > max_time:
+            impact_x[active[in_flight]] = S[in_flight, 0]
+            flight_time[active[in_flight]] = t
+            return
+
+        S = rk4_step_ensemble(S, dt, wind_x, wind_y, drag_model)
+        t += dt
+
+# --- 8. Adaptive Step Integrator (Dormand-Prince 4(5)) ---
+
+# Butcher tableau for the Dormand-Prince embedded pair. The 5th order solution is
+# propagated; the difference to the 4th order solution estimates the local error.
+DP_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+DP_B = [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0]
+DP_E = [71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40]
+
+# Continuous extension: S(t + theta*dt) = S + dt * sum_j k_j * sum_p DP_P[j][p] * theta^(p+1)
+DP_P = [
+    [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423],
+]
+
+def dopri5_step(S, dt, k1):
+    """
+    Performs one Dormand-Prince step from state S, where k1 = calculate_rates(S).
+    Returns (S_new, S_err, k) with k the list of all seven stage rates; k[6] is the
+    rate at S_new and can be reused as k1 of the next step (First Same As Last).
+    """
+    k = [k1]
+    for stage in range(1, 7):
+        S_stage = [S[i] + dt * sum(a * k[j][i] for j, a in enumerate(DP_A[stage]))
+                   for i in range(4)]
+        k.append(calculate_rates(S_stage))
+
+    # The last stage is evaluated at the 5th order solution itself
+    S_new = S_stage
+    S_err = [dt * sum(DP_E[j] * k[j][i] for j in range(7)) for i in range(4)]
+    return S_new, S_err, k
+
+def dopri5_dense(S, dt, k, theta):
+    """Interpolated state at fraction theta (0..1) of a step produced by dopri5_step."""
+    weights = [sum(P_j[p] * theta**(p + 1) for p in range(4)) for P_j in DP_P]
+    return [S[i] + dt * sum(weights[j] * k[j][i] for j in range(7)) for i in range(4)]
+
+def height_above_terrain(state):
+    """Event function for ground impact: positive in flight, zero on the terrain."""
+    return state[1] - terrain(state[0])
+
+def locate_impact(S, dt, k, g_start, g_end, tol=1e-10):
+    """
+    Finds the fraction theta of the step at which the trajectory meets the terrain,
+    using the Illinois (modified regula falsi) method on the dense output.
+    """
+    lo, hi = 0.0, 1.0
+    g_lo, g_hi = g_start, g_end
+    side = 0
+    while hi - lo > tol:
+        theta = (lo * g_hi - hi * g_lo) / (g_hi - g_lo)
+        g_mid = height_above_terrain(dopri5_dense(S, dt, k, theta))
+        if g_mid >= 0:
+            lo, g_lo = theta, g_mid
+            # Halve the stale end point if the same side is kept twice in a row
+            if side == -1:
+                g_hi /= 2
+            side = -1
+        else:
+            hi, g_hi = theta, g_mid
+            if side == 1:
+                g_lo /= 2
+            side = 1
+        if g_mid == 0:
+            return theta
+    return hi
+
+def simulate_shot_adaptive(angle_deg, v0=V0, rtol=1e-8, atol=1e-6, first_step=time_step,
+                           max_step=0.5, max_time=60.0, x_start=x0, y_start=y0):
+    """
+    Integrates a single shot with error-controlled Dormand-Prince steps and locates the
+    exact crossing of the piecewise-linear terrain from the step's dense output.
+
+    max_step limits how far one step can reach, so a short step never jumps over a ridge.
+
+    Returns a dict with 'range', 'flight_time', 'impact_x', 'impact_y', 'landed',
+    'n_rate_evals' (calls to calculate_rates) and 'trajectory' (accepted (x, y) points).
+    """
+    angle_rad = math.radians(angle_deg)
+    S = [x_start, y_start, v0 * math.cos(angle_rad), v0 * math.sin(angle_rad)]
+    trajectory = [(S[0], S[1])]
+
+    t = 0.0
+    dt = first_step
+    k1 = calculate_rates(S)
+    n_rate_evals = 1
+    g = height_above_terrain(S)
+    landed = False
+
+    while t < max_time:
+        dt = min(dt, max_step, max_time - t)
+        S_new, S_err, k = dopri5_step(S, dt, k1)
+        n_rate_evals += 6
+
+        # Weighted RMS error relative to the mixed absolute/relative tolerance
+        err_norm = math.sqrt(sum(
+            (S_err[i] / (atol + rtol * max(abs(S[i]), abs(S_new[i]))))**2 for i in range(4)) / 4)
+
+        if err_norm > 1:
+            # Reject the step and retry with a smaller one
+            dt *= max(0.2, 0.9 * err_norm**-0.2)
+            continue
+
+        g_new = height_above_terrain(S_new)
+        if g >= 0 > g_new:
+            theta = locate_impact(S, dt, k, g, g_new)
+            S = dopri5_dense(S, dt, k, theta)
+            t += theta * dt
+            trajectory.append((S[0], S[1]))
+            landed = True
+            break
+
+        S, k1, g = S_new, k[6], g_new
+        t += dt
+        trajectory.append((S[0], S[1]))
+
+        # Grow the next step, at most fivefold
+        dt *= 5.0 if err_norm == 0 else min(5.0, 0.9 * err_norm**-0.2)
+
+    return {
+        'range': S[0] - x_start,
+        'flight_time': t,
+        'impact_x': S[0],
+        'impact_y': terrain(S[0]),
+        'landed': landed,
+        'n_rate_evals': n_rate_evals,
+        'trajectory': trajectory,
+    }
+
+# --- 9. Simulation Loop ---
+
+def simulate_shot(angle_deg=ANGLE_DEG, dt=time_step, max_time=60.0, recorder=None):
+    """
+    Runs the fixed-step RK4 simulation for one launch angle.
+    The path is stored by recorder (a TrajectoryRecorder; by default every step is kept).
+    Returns (S, t, trajectory): final state, flight time and the recorded (x, y) points.
+    """
+    if recorder is None:
+        recorder = TrajectoryRecorder()
+    stepper = RK4Stepper(dt)
+
+    angle_rad = math.radians(angle_deg)
+    S = array('d', [x0, y0, V0 * math.cos(angle_rad), V0 * math.sin(angle_rad)])
+    t = 0
+    recorder.record(t, S)
+
+    # Run the simulation until the cannonball's height (S[1]) is less than or equal to the terrain height
+    # S[0] is x, S[1] is y
+    while S[1] >= terrain(S[0]):
+
+        # Safety Check: Limit flight time to prevent infinite loops (e.g., if the cannon shoots straight up)
+        if t > max_time:
+            break
+
+        # Advance the state using RK4 (in place)
+        stepper.step(S)
+        t += dt
+
+        # Store the new position
+        recorder.record(t, S)
+
+    recorder.finish(t, S)
+    return list(S), t, recorder.points()
+
+# --- 10. Final Results and Visualization ---
+
+def report_single_shot(angle_deg=ANGLE_DEG):
+    """Simulates one shot, prints the results and plots the trajectory over the terrain."""
+    S, t, trajectory = simulate_shot(angle_deg)
+    if t > 60: #Max 60s flight time
+        print("\nSimulation aborted: Flight time exceeded 60 seconds.")
+
+    final_range = S[0]
+    print(f"\n--- Simulation Results ---")
+    print(f"Launch Angle: {angle_deg} degrees")
+    print(f"Final Horizontal Range: {final_range:.2f} meters")
+    print(f"Final Flight Time: {t:.2f} seconds")
+    print(f"Note: Drag and Wind Factors included in calculations.")
+
+    # Cross-check against the adaptive integrator with exact impact location
+    adaptive = simulate_shot_adaptive(angle_deg)
+    print(f"Adaptive (Dormand-Prince) Range: {adaptive['range']:.2f} meters "
+          f"in {adaptive['flight_time']:.3f} seconds")
+    print(f"Rate Evaluations: {adaptive['n_rate_evals']} adaptive vs {4 * (len(trajectory) - 1)} fixed-step RK4")
+    print("\n")
+
+    # --- Matplotlib Plotting ---
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("\nWarning: Matplotlib not found. Install it to visualize the results.")
+        return
 
     # 1. Prepare Trajectory Data
     x_traj = [p[0] for p in trajectory]
     y_traj = [p[1] for p in trajectory]
 
     # 2. Prepare Terrain Data (for plotting smooth terrain)
-    # Create a dense array of x-points from 0 to 3000m
-    x_terrain = [i for i in range(int(TERRAIN_POINTS[-1][0]) + 1)]
-    y_terrain = [terrain(x) for x in x_terrain]
-    
+    # Create a dense array of x-points from 0 to the end of the profile (3000m)
+    x_terrain = np.arange(int(TERRAIN.x_end) + 1)
+    y_terrain = terrain_array(x_terrain)
+
     # 3. Create the Plot
     plt.figure(figsize=(12, 6))
-    
+
     # Plot the Terrain
     plt.plot(x_terrain, y_terrain, 'g-', label='Waterloo Terrain Profile', linewidth=2)
     plt.fill_between(x_terrain, y_terrain, min(y_terrain) - 10, color='lightgreen', alpha=0.5)
 
     # Plot the Trajectory
     plt.plot(x_traj, y_traj, 'r--', label='Cannonball Trajectory (RK4)')
-    
+
     # Mark the impact point
     plt.plot(final_range, terrain(final_range), 'ro', markersize=8, label='Impact Point')
 
-    plt.title(f'9-Pounder Cannon Range Simulation (Angle: {ANGLE_DEG}°)')
+    plt.title(f'9-Pounder Cannon Range Simulation (Angle: {angle_deg}°)')
     plt.xlabel('Horizontal Distance (m)')
     plt.ylabel('Altitude (m)')
     plt.grid(True)
@@ -210,5 +898,510 @@ try:
     plt.ylim(min(y_terrain) - 10, max(y_traj) * 1.1) # Set Y limits dynamically
     plt.show()
 
-except ImportError:
-    print("\nWarning: Matplotlib not found. Install it to visualize the results.")
+# --- 11. Firing Table Generator (Parallel Sweep) ---
+
+FIRING_TABLE_COLUMNS = ['shot', 'angle_deg', 'v0', 'wind_x', 'wind_y',
+                        'range', 'flight_time', 'impact_x', 'impact_y', 'landed']
+
+def parse_sweep(spec):
+    """
+    Parses a sweep specification: either 'start:stop:step' (stop included)
+    or a comma-separated list of values such as '5,10,15'.
+    """
+    if ':' in spec:
+        start, stop, step = (float(v) for v in spec.split(':'))
+        if step <= 0:
+            raise ValueError(f"Sweep step must be positive: {spec!r}")
+        n_values = int(math.floor((stop - start) / step + 1e-9)) + 1
+        return start + step * np.arange(n_values)
+    return np.array([float(v) for v in spec.split(',')])
+
+def firing_table_chunk(grid, chunk_index, chunk_size, dt=time_step, drag_model=None):
+    """
+    Simulates one chunk of the angle x V0 x WIND_X x WIND_Y grid (flat C-order index).
+    Returns (chunk_index, columns) with columns a dict named by FIRING_TABLE_COLUMNS.
+    """
+    shape = tuple(len(values) for values in grid)
+    n_total = math.prod(shape)
+    shot = np.arange(chunk_index * chunk_size, min((chunk_index + 1) * chunk_size, n_total))
+    i_angle, i_v0, i_wx, i_wy = np.unravel_index(shot, shape)
+
+    angle_deg = grid[0][i_angle]
+    v0 = grid[1][i_v0]
+    wind_x = grid[2][i_wx]
+    wind_y = grid[3][i_wy]
+    result = simulate_ensemble(angle_deg, v0, wind_x, wind_y, dt=dt, drag_model=drag_model)
+
+    columns = {'shot': shot, 'angle_deg': angle_deg, 'v0': v0, 'wind_x': wind_x, 'wind_y': wind_y}
+    columns.update(result)
+    return chunk_index, columns
+
+class CsvTableWriter:
+    """
+    Appends firing table chunks to one CSV file. A JSON sidecar ('<output>.progress.json')
+    records the completed chunks and the file size after the last complete chunk, so an
+    interrupted run can truncate any half-written chunk and carry on.
+    """
+
+    def __init__(self, path, signature, restart=False):
+        self.path = path
+        self.progress_path = path + '.progress.json'
+        self.signature = signature
+        self.completed = set()
+
+        if not restart and os.path.exists(self.progress_path):
+            with open(self.progress_path) as fh:
+                progress = json.load(fh)
+            if progress['signature'] != signature:
+                raise ValueError(f"{path} was started with different sweep settings; "
+                                 f"use --restart to overwrite it.")
+            self.completed = set(progress['completed'])
+            self.file = open(path, 'r+')
+            self.file.truncate(progress['bytes'])
+            self.file.seek(progress['bytes'])
+        else:
+            self.file = open(path, 'w')
+            self.file.write(','.join(FIRING_TABLE_COLUMNS) + '\n')
+            self._save_progress()
+
+    def write_chunk(self, chunk_index, columns):
+        table = np.column_stack([columns[name] for name in FIRING_TABLE_COLUMNS])
+        text = io.StringIO()
+        np.savetxt(text, table, delimiter=',', fmt=['%d'] + ['%.10g'] * 8 + ['%d'])
+        self.file.write(text.getvalue())
+        self.completed.add(chunk_index)
+        self._save_progress()
+
+    def _save_progress(self):
+        # Make the rows durable first, then atomically replace the progress record
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        progress = {'signature': self.signature, 'completed': sorted(self.completed),
+                    'bytes': self.file.tell()}
+        with open(self.progress_path + '.tmp', 'w') as fh:
+            json.dump(progress, fh)
+        os.replace(self.progress_path + '.tmp', self.progress_path)
+
+    def close(self):
+        self.file.close()
+
+class ParquetTableWriter:
+    """
+    Writes each firing table chunk as its own part file inside a directory. Parts are
+    written under a temporary name and renamed, so every existing part is complete.
+    """
+
+    def __init__(self, path, signature, restart=False):
+        import pyarrow
+        import pyarrow.parquet
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+        signature_path = os.path.join(path, '_sweep.json')
+        if restart:
+            for name in os.listdir(path):
+                if name.startswith('part-'):
+                    os.remove(os.path.join(path, name))
+        elif os.path.exists(signature_path):
+            with open(signature_path) as fh:
+                if json.load(fh) != signature:
+                    raise ValueError(f"{path} was started with different sweep settings; "
+                                     f"use --restart to overwrite it.")
+        with open(signature_path, 'w') as fh:
+            json.dump(signature, fh)
+
+        self.completed = {int(name[5:11]) for name in os.listdir(path)
+                          if name.startswith('part-') and name.endswith('.parquet')}
+
+    def write_chunk(self, chunk_index, columns):
+        table = self._pa.table({name: columns[name] for name in FIRING_TABLE_COLUMNS})
+        part_path = os.path.join(self.path, f'part-{chunk_index:06d}.parquet')
+        self._pq.write_table(table, part_path + '.tmp')
+        os.replace(part_path + '.tmp', part_path)
+        self.completed.add(chunk_index)
+
+    def close(self):
+        pass
+
+def generate_firing_table(output, angles, v0s, winds_x, winds_y, chunk_size=4096,
+                          workers=None, dt=time_step, restart=False, drag_model=None):
+    """
+    Sweeps every combination of launch angle, muzzle velocity and wind with a process
+    pool and streams the results to a firing table, one chunk of shots per task.
+    Output ending in '.parquet' is written as a directory of Parquet parts, anything
+    else as CSV. Chunks already present from an interrupted run are skipped.
+    """
+    # Workers get the drag model explicitly rather than relying on inherited globals
+    drag_model = drag_model or DRAG_MODEL
+    grid = tuple(np.asarray(values, dtype=float) for values in (angles, v0s, winds_x, winds_y))
+    n_total = math.prod(len(values) for values in grid)
+    n_chunks = -(-n_total // chunk_size)
+    signature = {'grid': [values.tolist() for values in grid], 'chunk_size': chunk_size, 'dt': dt,
+                 'drag': drag_model.name}
+
+    writer_class = ParquetTableWriter if output.endswith('.parquet') else CsvTableWriter
+    writer = writer_class(output, signature, restart=restart)
+    pending_chunks = [c for c in range(n_chunks) if c not in writer.completed]
+    if len(pending_chunks) < n_chunks:
+        print(f"Resuming {output}: {n_chunks - len(pending_chunks)}/{n_chunks} chunks already done.")
+
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+    workers = workers or os.cpu_count()
+    start_time = time.perf_counter()
+    n_done = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Keep a couple of chunks queued per worker without submitting the whole grid at once
+        pending_chunks = iter(pending_chunks)
+        in_flight = set()
+        while True:
+            for chunk_index in pending_chunks:
+                in_flight.add(pool.submit(firing_table_chunk, grid, chunk_index, chunk_size, dt, drag_model))
+                if len(in_flight) >= 2 * workers:
+                    break
+            if not in_flight:
+                break
+
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                chunk_index, columns = future.result()
+                writer.write_chunk(chunk_index, columns)
+                n_done += len(columns['shot'])
+            print(f"Chunks completed: {len(writer.completed)}/{n_chunks}", end='\r')
+
+    writer.close()
+    elapsed = time.perf_counter() - start_time
+    print(f"\nFiring table written to {output}: {n_done} shots in {elapsed:.1f} s "
+          f"({n_done / max(elapsed, 1e-9):.0f} shots/s on {workers} workers).")
+
+# --- 12. Inverse Ballistics (Launch Angle for a Target Range) ---
+
+def impact_range(angle_deg, dt=time_step):
+    """
+    Range of the fixed-step RK4 trajectory, with the ground crossing placed by linear
+    interpolation between the last step above and the first step below the terrain.
+    Unlike S[0] this changes continuously with the angle, which root-finders need.
+    """
+    # Only the last two positions are needed to place the crossing
+    S, t, trajectory = simulate_shot(angle_deg, dt, recorder=TrajectoryRecorder(capacity=2))
+    if len(trajectory) < 2:
+        return S[0] - x0
+
+    (xa, ya), (xb, yb) = trajectory[-2], trajectory[-1]
+    g_a = ya - terrain(xa)
+    g_b = yb - terrain(xb)
+    if g_b >= 0 or g_a < 0:
+        # Flight time limit reached rather than a terrain crossing
+        return xb - x0
+    return xa + (xb - xa) * g_a / (g_a - g_b) - x0
+
+class RangeSolver:
+    """
+    Finds the low and high launch angles that reach a requested range on the terrain.
+
+    Range rises with angle up to the maximum-range angle and falls beyond it, so that
+    apex is found first by a bounded Brent (golden-section plus parabolic) search and
+    cached. Each target then costs one Brent root search on each side of it. Evaluated
+    trajectories are cached by angle, so a batch of targets shares the apex search and
+    the bracket end points.
+    """
+
+    def __init__(self, angle_min=0.0, angle_max=89.0, xtol=1e-6, apex_xtol=1e-2,
+                 integrator='rk4', dt=time_step):
+        self.angle_min, self.angle_max = angle_min, angle_max
+        self.xtol = xtol
+        self.apex_xtol = apex_xtol
+        self.integrator = integrator
+        self.dt = dt
+        self.cache = {}
+        self.n_integrations = 0
+        self._apex = None
+
+    def range_at(self, angle_deg):
+        """Range for one launch angle, from the cache when it has been computed before."""
+        angle_deg = float(angle_deg)
+        if angle_deg not in self.cache:
+            self.n_integrations += 1
+            if self.integrator == 'adaptive':
+                self.cache[angle_deg] = simulate_shot_adaptive(angle_deg)['range']
+            else:
+                self.cache[angle_deg] = impact_range(angle_deg, self.dt)
+        return self.cache[angle_deg]
+
+    def apex(self):
+        """(angle, range) of the maximum-range shot, searched once and then cached."""
+        if self._apex is None:
+            from scipy.optimize import minimize_scalar
+
+            found = minimize_scalar(lambda a: -self.range_at(a), bounds=(self.angle_min, self.angle_max),
+                                    method='bounded', options={'xatol': self.apex_xtol})
+            # The bounded search never evaluates the end points themselves
+            self._apex = max(((float(found.x), -found.fun),
+                              (self.angle_min, self.range_at(self.angle_min)),
+                              (self.angle_max, self.range_at(self.angle_max))), key=lambda p: p[1])
+        return self._apex
+
+    def _bracket(self, end, apex_angle, target_range):
+        """
+        Tightest (low, high) angle bracket of the root between a short end and the apex,
+        from the angles already cached on that side (range is monotonic there).
+        """
+        lo, hi = sorted((end, apex_angle))
+        short, far = end, apex_angle
+        for angle, reached in self.cache.items():
+            if lo <= angle <= hi:
+                if reached < target_range and abs(angle - apex_angle) < abs(short - apex_angle):
+                    short = angle
+                elif reached > target_range and abs(angle - end) < abs(far - end):
+                    far = angle
+        return sorted((short, far))
+
+    def solve(self, target_range):
+        """
+        Returns (low_angle, high_angle) in degrees for the target range. Either is None
+        when there is no such solution (e.g. the target is beyond the maximum range);
+        both are the same angle if the target is only reached once.
+        """
+        from scipy.optimize import brentq
+
+        apex_angle, apex_range = self.apex()
+        if target_range > apex_range:
+            return None, None
+        if target_range == apex_range:
+            return apex_angle, apex_angle
+
+        # One root on each side of the apex, where the range at the bracket end falls short
+        roots = []
+        for end in (self.angle_min, self.angle_max):
+            residual = self.range_at(end) - target_range
+            if residual == 0:
+                roots.append(end)
+            elif residual < 0:
+                roots.append(brentq(lambda a: self.range_at(a) - target_range,
+                                    *self._bracket(end, apex_angle, target_range), xtol=self.xtol))
+
+        if not roots:
+            return None, None
+        return roots[0], roots[-1]
+
+    def solve_many(self, target_ranges):
+        """Solves a batch of targets, returning a list of (low_angle, high_angle) pairs."""
+        return [self.solve(target) for target in target_ranges]
+
+# --- 13. Monte Carlo Dispersion Analysis ---
+
+class DispersionStats:
+    """
+    Streaming summary of impact ranges: count, mean and variance (Welford/Chan updates)
+    plus fixed-width histograms of the range and of the miss distance from the aim
+    point, from which percentiles and the CEP are read. Nothing per shot is kept, and
+    two partial summaries can be merged exactly.
+    """
+
+    def __init__(self, aim_range, bin_width=0.25, max_range=10000.0):
+        self.aim_range = aim_range
+        self.bin_width = bin_width
+        self.n_bins = int(math.ceil(max_range / bin_width))
+        self.range_hist = np.zeros(self.n_bins, dtype=np.int64)
+        self.miss_hist = np.zeros(self.n_bins, dtype=np.int64)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.n_not_landed = 0
+
+    def _bins(self, values):
+        # Values outside the histogram are counted in its first/last bin
+        return np.clip((values / self.bin_width).astype(np.int64), 0, self.n_bins - 1)
+
+    def update(self, ranges, landed):
+        """Adds one batch of impact ranges (shots that never landed are only counted)."""
+        self.n_not_landed += int(np.count_nonzero(~landed))
+        ranges = ranges[landed]
+        if ranges.size == 0:
+            return
+
+        batch = DispersionStats(self.aim_range, self.bin_width, self.n_bins * self.bin_width)
+        batch.count = ranges.size
+        batch.mean = float(ranges.mean())
+        batch.m2 = float(((ranges - batch.mean)**2).sum())
+        batch.range_hist = np.bincount(self._bins(ranges), minlength=self.n_bins)
+        batch.miss_hist = np.bincount(self._bins(np.abs(ranges - self.aim_range)), minlength=self.n_bins)
+        self.merge(batch)
+
+    def merge(self, other):
+        """Combines another summary (same aim point and bins) into this one."""
+        n = self.count + other.count
+        if other.count:
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / n
+            self.m2 += other.m2 + delta**2 * self.count * other.count / n
+        self.count = n
+        self.range_hist += other.range_hist
+        self.miss_hist += other.miss_hist
+        self.n_not_landed += other.n_not_landed
+
+    def _quantile(self, hist, q):
+        # Linear interpolation inside the bin that holds the q-th fraction of shots
+        cumulative = np.cumsum(hist)
+        if cumulative[-1] == 0:
+            return float('nan')   # no shot landed
+        target = q * cumulative[-1]
+        # Counts are whole numbers, so searching for at least half a shot skips empty leading bins
+        i = int(np.searchsorted(cumulative, max(target, 0.5)))
+        below = cumulative[i] - hist[i]
+        return (i + (target - below) / hist[i]) * self.bin_width
+
+    def percentile(self, p):
+        """Range percentile p (0-100), accurate to the histogram bin width."""
+        return self._quantile(self.range_hist, p / 100)
+
+    @property
+    def std(self):
+        return math.sqrt(self.m2 / self.count) if self.count else float('nan')
+
+    @property
+    def cep(self):
+        """Circular error probable: the miss distance from the aim point that half the shots beat."""
+        return self._quantile(self.miss_hist, 0.5)
+
+    def summary(self, percentiles=(5, 25, 50, 75, 95)):
+        """Dictionary of the headline statistics."""
+        mean = self.mean if self.count else float('nan')
+        return {
+            'shots': self.count + self.n_not_landed,
+            'not_landed': self.n_not_landed,
+            'aim_range': self.aim_range,
+            'mean_range': mean,
+            'std_range': self.std,
+            'mean_error': mean - self.aim_range,
+            'cep': self.cep,
+            'percentiles': {p: self.percentile(p) for p in percentiles},
+        }
+
+def dispersion_batch(seed_seq, n_shots, angle_deg, sigmas, aim_range, dt=time_step,
+                     drag_model=None):
+    """
+    Draws and integrates one batch of perturbed shots with its own RNG stream.
+    sigmas = (sigma_v0, sigma_angle, sigma_gust); returns the batch's DispersionStats.
+    """
+    sigma_v0, sigma_angle, sigma_gust = sigmas
+    rng = np.random.default_rng(seed_seq)
+
+    angles = rng.normal(angle_deg, sigma_angle, n_shots)
+    v0s = rng.normal(V0, sigma_v0, n_shots)
+    winds_x = rng.normal(WIND_X, sigma_gust, n_shots)
+    winds_y = rng.normal(WIND_Y, sigma_gust, n_shots)
+    result = simulate_ensemble(angles, v0s, winds_x, winds_y, dt=dt, drag_model=drag_model)
+
+    stats = DispersionStats(aim_range)
+    stats.update(result['range'], result['landed'])
+    return stats
+
+def monte_carlo_dispersion(n_shots, angle_deg=ANGLE_DEG, sigma_v0=2.0, sigma_angle=0.1,
+                           sigma_gust=1.0, seed=None, batch_size=8192, workers=1,
+                           dt=time_step, drag_model=None):
+    """
+    Impact dispersion under random muzzle velocity, launch angle and wind gusts
+    (normal perturbations about V0, angle_deg, WIND_X and WIND_Y).
+
+    Batch i always uses child i of SeedSequence(seed) and batches are merged in order,
+    so a given seed gives identical statistics for any number of worker processes.
+    Returns the merged DispersionStats; the aim point is the unperturbed shot.
+    """
+    drag_model = drag_model or DRAG_MODEL
+    aim_range = float(simulate_ensemble(angle_deg, dt=dt, drag_model=drag_model)['range'][0])
+    sigmas = (sigma_v0, sigma_angle, sigma_gust)
+
+    n_batches = -(-n_shots // batch_size)
+    batch_sizes = [min(batch_size, n_shots - i * batch_size) for i in range(n_batches)]
+    seeds = np.random.SeedSequence(seed).spawn(n_batches)
+    args = [(seeds[i], batch_sizes[i], angle_deg, sigmas, aim_range, dt, drag_model)
+            for i in range(n_batches)]
+
+    total = DispersionStats(aim_range)
+    if workers == 1:
+        for batch_args in args:
+            total.merge(dispersion_batch(*batch_args))
+        return total
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map() yields in submission order, which keeps the merge order fixed
+        for stats in pool.map(dispersion_batch, *zip(*args)):
+            total.merge(stats)
+    return total
+
+# --- 14. Command-Line Entry Point ---
+
+def main(argv=None):
+    """Runs the single-shot demonstration, or generates a firing table with --table."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="9-pounder cannon range simulation over the Waterloo terrain.")
+    parser.add_argument('--angle', type=float, default=ANGLE_DEG, help="launch angle for the single-shot run (degrees)")
+    parser.add_argument('--table', metavar='OUTPUT', help="generate a firing table (.csv, or .parquet for a directory of parts)")
+    parser.add_argument('--angles', default='1:45:1', help="angle sweep, 'start:stop:step' or 'a,b,c' (degrees)")
+    parser.add_argument('--v0', default=str(V0), help="muzzle velocity sweep (m/s)")
+    parser.add_argument('--wind-x', default=str(WIND_X), help="horizontal wind sweep (m/s)")
+    parser.add_argument('--wind-y', default=str(WIND_Y), help="vertical wind sweep (m/s)")
+    parser.add_argument('--chunk-size', type=int, default=4096, help="shots per task and per write")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--dt', type=float, default=time_step, help="RK4 time step (s)")
+    parser.add_argument('--restart', action='store_true', help="discard an existing partial table instead of resuming")
+    parser.add_argument('--target-range', type=float, nargs='+', metavar='RANGE', help="solve for the launch angles that reach these ranges (m)")
+    parser.add_argument('--drag', choices=sorted(DRAG_MODELS), default='constant', help="atmosphere/drag model")
+    parser.add_argument('--benchmark-drag', action='store_true', help="time each drag model and exit")
+    parser.add_argument('--monte-carlo', type=int, metavar='SHOTS', help="impact dispersion analysis at --angle")
+    parser.add_argument('--seed', type=int, default=None, help="random seed for --monte-carlo")
+    parser.add_argument('--sigma-v0', type=float, default=2.0, help="muzzle velocity spread (m/s, 1 sigma)")
+    parser.add_argument('--sigma-angle', type=float, default=0.1, help="launch angle spread (degrees, 1 sigma)")
+    parser.add_argument('--sigma-gust', type=float, default=1.0, help="wind gust spread per component (m/s, 1 sigma)")
+    args = parser.parse_args(argv)
+
+    global DRAG_MODEL
+    DRAG_MODEL = DRAG_MODELS[args.drag]()
+
+    if args.benchmark_drag:
+        benchmark_drag_models()
+        return
+
+    if args.monte_carlo:
+        stats = monte_carlo_dispersion(args.monte_carlo, args.angle, args.sigma_v0, args.sigma_angle,
+                                       args.sigma_gust, seed=args.seed, workers=args.workers or os.cpu_count(),
+                                       dt=args.dt)
+        summary = stats.summary()
+        print(f"\n--- Monte Carlo Dispersion ({summary['shots']} shots at {args.angle} degrees) ---")
+        print(f"Aim Point (unperturbed range): {summary['aim_range']:.2f} meters")
+        print(f"Mean Range: {summary['mean_range']:.2f} meters (std {summary['std_range']:.2f})")
+        print(f"CEP: {summary['cep']:.2f} meters")
+        for p, value in summary['percentiles'].items():
+            print(f"{p:>3}th Percentile Range: {value:.2f} meters")
+        if summary['not_landed']:
+            print(f"Shots stopped by the flight time limit: {summary['not_landed']}")
+        return
+
+    if args.target_range:
+        solver = RangeSolver(dt=args.dt)
+        print("\n--- Launch Angle Solutions ---")
+        for target, (low, high) in zip(args.target_range, solver.solve_many(args.target_range)):
+            if low is None:
+                print(f"Range {target:.1f} m: out of reach")
+            else:
+                print(f"Range {target:.1f} m: low angle {low:.4f} deg, high angle {high:.4f} deg")
+        print(f"Trajectories integrated: {solver.n_integrations}")
+        return
+
+    if args.table is None:
+        report_single_shot(args.angle)
+        return
+
+    generate_firing_table(args.table, parse_sweep(args.angles), parse_sweep(args.v0),
+                          parse_sweep(args.wind_x), parse_sweep(args.wind_y),
+                          chunk_size=args.chunk_size, workers=args.workers, dt=args.dt,
+                          restart=args.restart)
+
+if __name__ == "__main__":
+    main()